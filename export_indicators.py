@@ -67,6 +67,10 @@ STATUS_COLOURS = {
 # Timer interval
 _TIMER_INTERVAL_SECONDS = 5.0
 
+# Editors that show export indicators: object colours in the viewport (and the
+# add-on's sidebar panels), custom properties in the outliner/properties editor
+REDRAW_AREA_TYPES = frozenset(("VIEW_3D", "OUTLINER", "PROPERTIES"))
+
 
 # --- Core Functions ---
 
@@ -108,7 +112,7 @@ def mark_object_as_exported(obj):
     obj[EXPORT_TIME_PROP] = time.time()
     obj[EXPORT_STATUS_PROP] = ExportStatus.FRESH.value
     set_object_colour(obj)
-    logger.info(f"Marked {obj.name} as freshly exported")
+    logger.info("Marked %s as freshly exported", obj.name)
 
     # Invalidate cache since we added a new exported object
     global _cache_last_update
@@ -438,6 +442,31 @@ def update_all_export_statuses():
     return needs_redraw
 
 
+def redraw_indicator_areas(window_manager):
+    """
+    Tag the editors that display export indicators for redraw.
+
+    Other editors (timelines, node editors, text editors, ...) never show
+    indicator state, so they are left alone rather than invalidated.
+
+    Args:
+        window_manager (bpy.types.WindowManager): Window manager to walk
+
+    Returns:
+        None
+    """
+    for window in window_manager.windows:
+        if not window.screen:
+            continue
+        for area in window.screen.areas:
+            if area.type not in REDRAW_AREA_TYPES:
+                continue
+            try:
+                area.tag_redraw()
+            except ReferenceError:
+                pass  # Area might close
+
+
 def get_recently_exported_objects():
     """Get a list of objects with active FRESH/STALE status, sorted."""
     exported_objects = []
@@ -477,25 +506,13 @@ def update_timer_callback():
         status_updated = update_all_export_statuses()
 
         if status_updated:
-            # More aggressive UI updating
             context = bpy.context
             if (
                 context
                 and hasattr(context, "window_manager")
                 and context.window_manager
             ):
-                for window in context.window_manager.windows:
-                    if not hasattr(window, "screen") or not window.screen:
-                        continue
-                    for area in window.screen.areas:
-                        try:
-                            # Force update for all area types
-                            area.tag_redraw()
-                        except Exception as e:
-                            # Log potential errors during redraw
-                            # without stopping timer
-                            logger.debug(f"Error redrawing area {area.type}: {e}")
-                            pass
+                redraw_indicator_areas(context.window_manager)
             else:
                 logger.warning("Timer callback couldn't redraw: invalid context")
     except Exception as e:
@@ -547,14 +564,7 @@ class MESH_OT_clear_all_indicators(Operator):
 
         # Trigger redraw after clearing
         if context and context.window_manager:
-            for window in context.window_manager.windows:
-                if not window.screen:
-                    continue
-                for area in window.screen.areas:
-                    try:
-                        area.tag_redraw()
-                    except ReferenceError:
-                        pass  # Area might close
+            redraw_indicator_areas(context.window_manager)
         return {"FINISHED"}
 
 
@@ -574,10 +584,7 @@ class MESH_OT_debug_update_indicators(Operator):
         logger.info(msg)
 
         # Force redraw
-        for window in context.window_manager.windows:
-            if window.screen:
-                for area in window.screen.areas:
-                    area.tag_redraw()
+        redraw_indicator_areas(context.window_manager)
 
         return {"FINISHED"}
 
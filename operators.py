@@ -8,13 +8,19 @@ texture compression, and cleanup of temporary objects.
 import bpy
 import bmesh
 import os
+import shutil
+import tempfile
 import time
 import contextlib
+import gc
 import re
 import math
 import logging
 import json
+import numpy as np
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from types import SimpleNamespace
 from mathutils import Matrix
 from bpy_extras.io_utils import axis_conversion
 from typing import Optional, Tuple, List, Iterator, Any
@@ -99,6 +105,9 @@ logger.propagate = False
 EXPORT_TIME_PROP = "mesh_export_timestamp"
 EXPORT_STATUS_PROP = "mesh_export_status"
 
+# Object types the batch exporter accepts (curves/metaballs convert to mesh)
+EXPORTABLE_OBJECT_TYPES = frozenset(("MESH", "CURVE", "META"))
+
 # Memory management thresholds
 # These values are based on typical workstation memory (16-32GB) and
 # observed performance characteristics during mesh processing operations.
@@ -112,15 +121,24 @@ CACHE_UPDATE_INTERVAL = (
     10.0  # Seconds between cache refreshes (balances performance vs freshness)
 )
 DEFAULT_GC_INTERVAL = 5.0  # Default minimum seconds between GC calls (prevents stutter)
+GC_REQUEST_BATCH_SIZE = 4  # Unforced cleanup requests folded into one collection
+# A full gc.collect() walks every tracked Python object in Blender's process and
+# can take hundreds of milliseconds; only run it when explicitly requested.
+FORCE_GC = os.environ.get("MESH_EXPORT_FORCE_GC") == "1"
 
 # Unit conversion constants
 METERS_TO_CENTIMETERS = (
     100.0  # Conversion factor from metres (Blender default) to centimetres
 )
+# Squared tolerance for "is this scale 1.0" checks: 1e-6 per unit, well below
+# human-perceptible scale differences. Squared so callers can skip abs()/sqrt()
+SCALE_EPSILON_SQ = 1e-12
 
 # File naming constants
 MAX_FILENAME_LENGTH = 100  # Conservative limit to avoid filesystem issues across OS
 FILENAME_TRUNCATE_SUFFIX = "..."  # Suffix appended to truncated names
+# Filesystem-illegal characters (plus "."), mapped to "_" for sanitise_filename
+FILENAME_ILLEGAL_CHARS_TABLE = str.maketrans(dict.fromkeys('\\/:*?"<>|.', "_"))
 
 # Known Unreal Engine prefixes (used in naming convention)
 # See: https://docs.unrealengine.com/5.0/en-US/asset-naming-conventions-in-unreal-engine/  # noqa: E501
@@ -155,6 +173,64 @@ COLLISION_SHAPE_PREFIXES = {
 GODOT_COLLISION_SUFFIX_ONLY = "-convcolonly"  # Collision only (not rendered)
 GODOT_COLLISION_SUFFIX_VISUAL = "-convcol"  # Collision + rendered visual
 
+# LOD naming constants
+LOD_SUFFIX_RE = re.compile(r"_LOD(\d{2})$")  # Trailing "_LODnn" on export copies
+# LOD level -> USDZ texture downscale size (other levels keep full size)
+USDZ_LOD_DOWNSCALE_SIZES = {1: "2048", 2: "1024", 3: "512", 4: "256"}
+
+# Image extensions counted as textures next to a separate-file glTF export
+GLTF_TEXTURE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp")
+
+# Size of the GLB file header (magic, version, length) preceding the chunks
+GLB_HEADER_SIZE = 12
+
+# Binary STL layout: 80-byte header, uint32 triangle count, then one packed
+# 50-byte record per triangle (facet normal, three vertices, attribute count)
+STL_HEADER = b"Binary STL written by EasyMesh Batch Exporter".ljust(80, b" ")
+STL_TRIANGLE_DTYPE = np.dtype(
+    [("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attributes", "<u2")]
+)
+
+# Texture resamples running ahead of the writes in save_external_textures;
+# each holds one full-resolution float32 source buffer while it runs
+MAX_TEXTURE_RESAMPLES_IN_FLIGHT = 2
+
+# Background file I/O (staged export moves, STL record writes)
+BACKGROUND_WRITE_WORKERS = 2
+MAX_PENDING_BACKGROUND_WRITES = 4  # Block the batch once this many are queued
+
+# Triangulation constants
+# Triangulate modifier quad_method -> bmesh.ops.triangulate quad_method
+BMESH_QUAD_METHODS = {
+    "BEAUTY": "BEAUTY",
+    "FIXED": "FIXED",
+    "FIXED_ALTERNATE": "ALTERNATE",
+    "SHORTEST_DIAGONAL": "SHORT_EDGE",
+    "LONGEST_DIAGONAL": "LONG_EDGE",
+}
+
+# Texture classification constants
+# Name hints for normal maps ("norm" also covers "normal"), matched in one scan
+NORMAL_MAP_NODE_NAME_RE = re.compile(r"norm|nrm|bump", re.IGNORECASE)
+NORMAL_MAP_IMAGE_NAME_RE = re.compile(r"norm|nrm|bump|_n[._]", re.IGNORECASE)
+NORMAL_MAP_SOCKET_NAMES = frozenset(("normal", "normal map"))
+NON_COLOR_COLORSPACES = frozenset(("Non-Color", "Linear", "Raw"))
+COLOR_SOCKET_NAMES = frozenset(("Base Color", "Color"))
+# Image file_format -> file extension for externally saved textures
+TEXTURE_FORMAT_EXTENSIONS = {
+    "JPEG": ".jpg",
+    "PNG": ".png",
+    "TARGA": ".tga",
+    "HDR": ".hdr",
+    "OPEN_EXR": ".exr",
+}
+# File extension -> Image file_format, for copying source files unchanged
+TEXTURE_EXTENSION_FORMATS = {
+    **{ext: fmt for fmt, ext in TEXTURE_FORMAT_EXTENSIONS.items()},
+    ".jpeg": "JPEG",
+    ".targa": "TARGA",
+}
+
 # Preset system constants
 MAX_PRESET_NAME_LENGTH = 50  # Maximum characters for preset names
 PRESET_FILE_EXTENSION = ".json"  # File extension for preset files
@@ -262,6 +338,208 @@ def temporary_image_file(filepath: str) -> Iterator[str]:
                 logger.warning(f"Failed to cleanup temporary file {filepath}: {e}")
 
 
+# In-flight background file I/O - staged export moves and STL record writes -
+# drained by flush_background_writes() once the batch finishes. Each write is
+# attributed to the owner set by background_write_owner() when it was queued,
+# and carries the number of exports the batch counted for it
+_background_write_executor = None
+_background_write_owner = None
+_pending_background_writes = []  # [(future, destination path, owner, exports)]
+_failed_background_writes = []  # [(destination path, owner, exports)] that raised
+
+
+def _move_staged_export(staged_path: str, filepath: str, staging_dir: str) -> None:
+    """Copy a staged export into place and remove its staging directory.
+
+    The copy goes through atomic_write_path, so a failed move never leaves a
+    partial file at the destination.
+    """
+    try:
+        with atomic_write_path(filepath) as write_path:
+            shutil.copyfile(staged_path, write_path)
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+def _finish_background_write(future, filepath: str, owner, exports: int) -> None:
+    """Wait for one background write, recording the destination if it failed."""
+    try:
+        future.result()
+        logger.debug(f"Finished background write of {filepath}")
+    except Exception as e:
+        logger.error(f"Background write of {filepath} failed: {e}")
+        _failed_background_writes.append((filepath, owner, exports))
+
+
+@contextlib.contextmanager
+def background_write_owner(owner) -> Iterator[None]:
+    """Context manager attributing background writes queued inside it to ``owner``.
+
+    flush_background_writes() reports failed writes with their owner, so the
+    batch can tell which object's export did not reach the disk.
+
+    Args:
+        owner: Identifier reported with failed writes (e.g. an object name)
+    """
+    global _background_write_owner
+    previous = _background_write_owner
+    _background_write_owner = owner
+    try:
+        yield
+    finally:
+        _background_write_owner = previous
+
+
+def _submit_background_write(filepath: str, func, *args, exports: int = 1) -> None:
+    """
+    Run one file I/O job on a worker thread.
+
+    Jobs are plain file I/O with no bpy access, so they overlap with the next
+    object's processing on the main thread. The queue is bounded by
+    MAX_PENDING_BACKGROUND_WRITES so buffered exports cannot pile up in memory
+    or the temp directory faster than the destination accepts them.
+
+    Args:
+        filepath: Final destination path, reported if the job fails
+        func: Callable performing the I/O
+        *args: Arguments for ``func``
+        exports: Number of exports the batch counts for this file
+    """
+    global _background_write_executor
+    if _background_write_executor is None:
+        _background_write_executor = ThreadPoolExecutor(
+            max_workers=BACKGROUND_WRITE_WORKERS, thread_name_prefix="easymesh_write"
+        )
+    while len(_pending_background_writes) >= MAX_PENDING_BACKGROUND_WRITES:
+        _finish_background_write(*_pending_background_writes.pop(0))
+    future = _background_write_executor.submit(func, *args)
+    _pending_background_writes.append(
+        (future, filepath, _background_write_owner, exports)
+    )
+
+
+def queue_staged_move(
+    staged_path: str, filepath: str, staging_dir: str, exports: int = 1
+) -> None:
+    """
+    Move a staged export into place on a worker thread.
+
+    Args:
+        staged_path: File written by the exporter in the staging directory
+        filepath: Final destination path of the export
+        staging_dir: Staging directory to remove once the move completes
+        exports: Number of exports the batch counts for this file
+    """
+    _submit_background_write(
+        filepath,
+        _move_staged_export,
+        staged_path,
+        filepath,
+        staging_dir,
+        exports=exports,
+    )
+
+
+def flush_background_writes():
+    """
+    Wait for all queued background writes and shut the worker threads down.
+
+    Returns:
+        list: (destination path, owner, exports) for each write that failed
+        since the last flush
+    """
+    global _background_write_executor
+    while _pending_background_writes:
+        _finish_background_write(*_pending_background_writes.pop(0))
+    if _background_write_executor is not None:
+        _background_write_executor.shutdown(wait=True)
+        _background_write_executor = None
+    failed = list(_failed_background_writes)
+    _failed_background_writes.clear()
+    return failed
+
+
+@contextlib.contextmanager
+def staged_export_file(
+    filepath: str, enabled: bool = True, background: bool = False, exports: int = 1
+) -> Iterator[str]:
+    """Context manager that writes an export to the temp directory, then moves it.
+
+    Exporters such as FBX issue many small writes; on slow or network storage
+    each one stalls the main thread. Staging in the system temp directory
+    (typically RAM-backed or page-cached) turns those into a single sequential
+    copy. Staging is skipped when the temp directory shares a filesystem with
+    the destination, since the writes would land on the same device anyway.
+
+    Args:
+        filepath: Final destination path of the export
+        enabled: Set False to write straight to ``filepath``
+        background: Hand the final copy to queue_staged_move() instead of
+            blocking on it; callers must call flush_background_writes() afterwards
+        exports: Number of exports the batch counts for this file, reported
+            with it if the background copy fails
+
+    Yields:
+        The path the exporter should write to
+    """
+    export_dir = os.path.dirname(filepath) or os.curdir
+    staging_root = tempfile.gettempdir()
+    try:
+        same_device = os.stat(export_dir).st_dev == os.stat(staging_root).st_dev
+    except OSError:
+        same_device = True  # Can't tell - write directly
+
+    if not enabled or same_device:
+        yield filepath
+        return
+
+    staging_dir = tempfile.mkdtemp(prefix="easymesh_export_")
+    staged_path = os.path.join(staging_dir, os.path.basename(filepath))
+    handed_off = False
+    try:
+        yield staged_path
+        if os.path.exists(staged_path):
+            # Cross-device, so this is a copy followed by removal of the source
+            if background:
+                queue_staged_move(staged_path, filepath, staging_dir, exports)
+                handed_off = True  # The worker removes staging_dir
+            else:
+                shutil.move(staged_path, filepath)
+                logger.debug(f"Moved staged export to {filepath}")
+    finally:
+        if not handed_off:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+@contextlib.contextmanager
+def atomic_write_path(filepath: str) -> Iterator[str]:
+    """Context manager that writes to a sibling temp file, then renames it.
+
+    The temp file lives in the destination directory, so the final
+    ``os.replace`` is an atomic same-filesystem rename: readers and filesystem
+    watchers only ever see a missing or a complete file, never a partial one.
+
+    Args:
+        filepath: Final destination path
+
+    Yields:
+        The path to write to
+    """
+    directory, name = os.path.split(filepath)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=directory or os.curdir,
+        prefix=f".{os.path.splitext(name)[0]}_",
+        suffix=os.path.splitext(name)[1],
+    )
+    os.close(fd)
+    try:
+        yield tmp_path
+        os.replace(tmp_path, filepath)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
 # --- Memory Management Utilities ---
 
 
@@ -273,6 +551,7 @@ class MemoryManager:
         DEFAULT_GC_INTERVAL  # Minimum seconds between gc.collect() calls
     )
     _pending_cleanup: bool = False
+    _requests_since_gc: int = 0  # Unforced requests since the last collection
     _adaptive_mode: bool = True  # Whether to adjust interval based on mesh size
 
     @classmethod
@@ -302,6 +581,10 @@ class MemoryManager:
     def request_cleanup(cls, force: bool = False, poly_count: int = 0) -> None:
         """Request garbage collection, but throttle to avoid performance issues.
 
+        Unforced requests are amortised: a collection runs at most once per
+        ``GC_REQUEST_BATCH_SIZE`` requests and once per interval; anything
+        left over is collected by ``cleanup_if_pending`` at the end of a batch.
+
         Args:
             force: If True, bypass throttling and force immediate collection
             poly_count: Number of polygons being processed (for adaptive mode)
@@ -318,12 +601,21 @@ class MemoryManager:
             elif poly_count > LARGE_MESH_THRESHOLD:  # 500K+ polygons
                 effective_interval = max(3.0, cls._gc_interval * 0.75)
 
-        if force or (current_time - cls._last_gc_time) >= effective_interval:
-            import gc
+        if not force:
+            cls._requests_since_gc += 1
 
-            gc.collect()
+        if force or (
+            cls._requests_since_gc >= GC_REQUEST_BATCH_SIZE
+            and (current_time - cls._last_gc_time) >= effective_interval
+        ):
             cls._last_gc_time = current_time
             cls._pending_cleanup = False
+            cls._requests_since_gc = 0
+            if not FORCE_GC:
+                logger.debug("Garbage collection skipped (MESH_EXPORT_FORCE_GC unset)")
+                return
+
+            gc.collect()
             logger.debug(
                 f"Garbage collection performed "
                 f"(forced={force}, interval={effective_interval:.1f}s)"
@@ -332,7 +624,8 @@ class MemoryManager:
             cls._pending_cleanup = True
             logger.debug(
                 f"Garbage collection deferred "
-                f"(too frequent, interval={effective_interval:.1f}s)"
+                f"({cls._requests_since_gc}/{GC_REQUEST_BATCH_SIZE} requests, "
+                f"interval={effective_interval:.1f}s)"
             )
 
     @classmethod
@@ -347,21 +640,27 @@ class MeshOperations:
 
     @staticmethod
     def update_mesh_data(
-        obj: Optional[Object], with_memory_cleanup: bool = False
+        obj: Optional[Object],
+        with_memory_cleanup: bool = False,
+        poly_count: Optional[int] = None,
     ) -> None:
         """Update mesh data and optionally trigger memory cleanup for large meshes.
 
         Args:
             obj: The object whose mesh data to update
             with_memory_cleanup: Whether to trigger garbage collection for large meshes
+            poly_count: Polygon count the caller already measured, to skip
+                another RNA length query
         """
         if not obj or not obj.data:
             return
 
-        obj.data.update()
+        mesh = obj.data
+        mesh.update()
 
         if with_memory_cleanup:
-            poly_count = len(obj.data.polygons) if hasattr(obj.data, "polygons") else 0
+            if poly_count is None:
+                poly_count = len(mesh.polygons) if hasattr(mesh, "polygons") else 0
             if poly_count > LARGE_MESH_THRESHOLD:
                 MemoryManager.request_cleanup(poly_count=poly_count)
                 logger.debug(
@@ -377,6 +676,52 @@ class MeshOperations:
         except Exception as e:
             logger.warning(f"Failed to update view layer: {e}")
 
+    @staticmethod
+    def object_override(obj: Object) -> dict:
+        """Build a minimal context override targeting a single object.
+
+        Cheaper than ``bpy.context.copy()``, which copies every context member,
+        and sufficient for object-level operators such as ``modifier_apply``.
+
+        Args:
+            obj: The object the operator should act on
+
+        Returns:
+            Keyword arguments for ``bpy.context.temp_override``
+        """
+        return {
+            "object": obj,
+            "active_object": obj,
+            "selected_objects": [obj],
+            "selected_editable_objects": [obj],
+        }
+
+    @staticmethod
+    def bake_evaluated_mesh(obj: Object) -> Mesh:
+        """Replace an object's mesh with its evaluated (modifier-applied) mesh.
+
+        One depsgraph evaluation and no operator, undo push or selection sync.
+        Modifiers are left on the object; callers remove the ones they baked.
+
+        Args:
+            obj: The mesh object to bake
+
+        Returns:
+            The new mesh datablock, renamed to match the one it replaced
+        """
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        eval_obj = obj.evaluated_get(depsgraph)
+        new_mesh = bpy.data.meshes.new_from_object(
+            eval_obj, preserve_all_data_layers=True, depsgraph=depsgraph
+        )
+        old_mesh = obj.data
+        mesh_name = old_mesh.name
+        obj.data = new_mesh
+        if old_mesh.users == 0:
+            bpy.data.meshes.remove(old_mesh)
+        new_mesh.name = mesh_name
+        return new_mesh
+
     @staticmethod
     def safe_operator_call(
         operator_func: Any, error_msg: str = "Operator call failed", **kwargs: Any
@@ -454,7 +799,9 @@ def optimise_for_large_mesh(obj: Optional[Object]) -> bool:
         logger.info(
             f"Applying memory optimisation for large mesh: {poly_count} polygons"
         )
-        MeshOperations.update_mesh_data(obj, with_memory_cleanup=True)
+        MeshOperations.update_mesh_data(
+            obj, with_memory_cleanup=True, poly_count=poly_count
+        )
         return True
     return False
 
@@ -529,7 +876,7 @@ def create_slot_empties(obj: Object, scene_props, context: Context) -> List[Obje
 
     for child in obj.children:
         # Only create slots for mesh children (not empties or other types)
-        if child.type not in ("MESH", "CURVE", "META"):
+        if child.type not in EXPORTABLE_OBJECT_TYPES:
             continue
 
         # Apply naming convention to child name for the slot
@@ -808,13 +1155,18 @@ def copy_collision_for_export(
 
 
 @contextlib.contextmanager
-def safe_large_mesh_operation(obj, operation_name):
+def safe_large_mesh_operation(obj, operation_name, post_update=False):
     """
     Context manager for operations on large meshes with memory management.
 
+    The wrapper does not retessellate the mesh itself - operators run inside
+    the block already update the data they touch.
+
     Args:
         obj (bpy.types.Object): The mesh object.
         operation_name (str): Name of the operation for logging.
+        post_update (bool): Call ``Mesh.update()`` once the block finishes,
+            for callers that edit mesh data directly.
     """
     poly_count = len(obj.data.polygons) if obj and obj.data else 0
     is_large = poly_count > LARGE_MESH_THRESHOLD
@@ -825,14 +1177,20 @@ def safe_large_mesh_operation(obj, operation_name):
             f"on {poly_count:,} polygons"
         )
         # Pre-operation cleanup
-        MeshOperations.update_mesh_data(obj, with_memory_cleanup=True)
+        MemoryManager.request_cleanup(poly_count=poly_count)
 
     try:
         yield
     finally:
+        if post_update:
+            # Reuse the count captured on entry - it only selects the
+            # cleanup interval
+            MeshOperations.update_mesh_data(
+                obj, with_memory_cleanup=is_large, poly_count=poly_count
+            )
+        elif is_large:
+            MemoryManager.request_cleanup(poly_count=poly_count)
         if is_large:
-            # Post-operation cleanup
-            MeshOperations.update_mesh_data(obj, with_memory_cleanup=True)
             logger.info(f"Completed large mesh operation: {operation_name}")
 
 
@@ -853,54 +1211,62 @@ def temp_selection_context(context, active_object=None, selected_objects=None):
     Returns:
         None
     """
-    # Store original state
+    # Store original state. context.selected_objects is maintained by Blender,
+    # so snapshotting it avoids a select_get() call on every object in the scene.
     original_active = context.view_layer.objects.active
-    original_selected = [obj for obj in context.scene.objects if obj.select_get()]
+    original_selected = list(context.selected_objects)
+    # scene.objects has no name index, so each "name in scene.objects" test
+    # walks the whole scene; take the names once per pass instead
+    scene_names = {obj.name for obj in context.scene.objects}
 
     try:
-        # Deselect all objects directly
-        for obj in context.scene.objects:
-            if obj.select_get():
-                obj.select_set(False)
+        # Deselect only what is currently selected
+        for obj in original_selected:
+            obj.select_set(False)
 
         # Select requested objects directly
+        valid = []
         if selected_objects:
             if not isinstance(selected_objects, list):
                 selected_objects = [selected_objects]
+            valid = [obj for obj in selected_objects if obj and obj.name in scene_names]
 
-            for obj in selected_objects:
-                if obj and obj.name in context.scene.objects:
-                    try:
-                        obj.select_set(True)
-                    except ReferenceError:
-                        logger.warning(
-                            f"Could not select '{obj.name}' - object reference invalid."
-                        )
+            for obj in valid:
+                try:
+                    obj.select_set(True)
+                except ReferenceError:
+                    logger.warning(
+                        f"Could not select '{obj.name}' - object reference invalid."
+                    )
 
         # Set active object directly
-        if active_object and active_object.name in context.scene.objects:
+        if active_object and active_object.name in scene_names:
             context.view_layer.objects.active = active_object
-        elif selected_objects:
-            for obj in selected_objects:
-                if obj and obj.name in context.scene.objects:
-                    context.view_layer.objects.active = obj
-                    break
+        elif valid:
+            context.view_layer.objects.active = valid[0]
 
         yield
 
     finally:
-        # Restore original state directly
-        for obj in context.scene.objects:
-            obj.select_set(False)
+        # Restore original state directly. Operators run inside the block may
+        # have changed the selection (e.g. a duplicate becomes selected), so
+        # clear whatever is selected now rather than only what we selected.
+        for obj in list(context.selected_objects):
+            try:
+                obj.select_set(False)
+            except ReferenceError:
+                pass
 
+        # Re-read: the block may have added or removed scene objects
+        scene_names = {obj.name for obj in context.scene.objects}
         for obj in original_selected:
-            if obj and obj.name in context.scene.objects:
-                try:
+            try:
+                if obj and obj.name in scene_names:
                     obj.select_set(True)
-                except ReferenceError:
-                    pass
+            except ReferenceError:
+                pass  # Removed while the context was active
 
-        if original_active and original_active.name in context.scene.objects:
+        if original_active and original_active.name in scene_names:
             try:
                 context.view_layer.objects.active = original_active
             except ReferenceError:
@@ -1291,7 +1657,7 @@ def create_export_copy(original_obj, context):
     if not original_obj:
         raise ValidationError("Cannot copy None object")
 
-    if original_obj.type not in ["MESH", "CURVE", "META"]:
+    if original_obj.type not in EXPORTABLE_OBJECT_TYPES:
         raise ValidationError(f"Invalid object type '{original_obj.type}' for copying")
 
     temp_metaball_mesh = None
@@ -1309,13 +1675,26 @@ def create_export_copy(original_obj, context):
 
             if mesh and len(mesh.vertices) > 0:
                 # Create a new mesh object with the converted mesh
+                # Bulk-copy geometry through foreach_get/foreach_set rather
+                # than building Python lists vertex by vertex
+                vert_count = len(mesh.vertices)
+                loop_count = len(mesh.loops)
+                poly_count = len(mesh.polygons)
+                coords = np.empty(vert_count * 3, dtype=np.float32)
+                loop_verts = np.empty(loop_count, dtype=np.int32)
+                loop_starts = np.empty(poly_count, dtype=np.int32)
+                mesh.vertices.foreach_get("co", coords)
+                mesh.loops.foreach_get("vertex_index", loop_verts)
+                mesh.polygons.foreach_get("loop_start", loop_starts)
+
                 new_mesh = bpy.data.meshes.new(name=f"{original_obj.name}_mesh")
-                new_mesh.from_pydata(
-                    [v.co for v in mesh.vertices],
-                    [e.vertices for e in mesh.edges],
-                    [p.vertices for p in mesh.polygons],
-                )
-                new_mesh.update()
+                new_mesh.vertices.add(vert_count)
+                new_mesh.vertices.foreach_set("co", coords)
+                new_mesh.loops.add(loop_count)
+                new_mesh.loops.foreach_set("vertex_index", loop_verts)
+                new_mesh.polygons.add(poly_count)
+                new_mesh.polygons.foreach_set("loop_start", loop_starts)
+                new_mesh.update(calc_edges=True)
 
                 mesh_obj = bpy.data.objects.new(
                     name=f"{original_obj.name}_converted", object_data=new_mesh
@@ -1343,8 +1722,9 @@ def create_export_copy(original_obj, context):
                 # Use modern Blender 4.1+ API for smooth shading
                 try:
                     # Apply basic smooth shading
-                    for poly in mesh_obj.data.polygons:
-                        poly.use_smooth = True
+                    mesh_obj.data.polygons.foreach_set(
+                        "use_smooth", np.ones(poly_count, dtype=bool)
+                    )
 
                     # For Blender 4.1+, use "Smooth by Angle" modifier
                     # instead of deprecated operator
@@ -1380,84 +1760,61 @@ def create_export_copy(original_obj, context):
             # Always clean up the evaluated mesh
             obj_eval.to_mesh_clear()
 
-    logger.info(f"Attempting to duplicate '{original_obj.name}' using operator...")
+    logger.info(f"Duplicating '{original_obj.name}' via the data API...")
 
-    # Use the context manager to handle selection and active object
-    with temp_selection_context(
-        context, active_object=original_obj, selected_objects=[original_obj]
-    ):
-        try:
-            # Duplicate the active object (linked)
-            # more direct and conventional way to perform a non-interactive
-            # linked duplication than bpy.ops.object.duplicate(linked=True)
-            success, result = MeshOperations.safe_operator_call(
-                bpy.ops.object.duplicate_move_linked,
-                f"Failed to duplicate object '{original_obj.name}'",
-                OBJECT_OT_duplicate={"linked": True, "mode": "TRANSLATION"},
-                TRANSFORM_OT_translate={"value": (0, 0, 0)},  # No actual move
-            )
-
-            if not success:
-                raise ProcessingError(
-                    f"Operator duplicate_move_linked failed for '{original_obj.name}'"
-                )
-
-            # The new duplicate becomes the active object
-            # after the operator runs
-            copy_obj = context.view_layer.objects.active
-            if not copy_obj:
-                raise ProcessingError(
-                    f"No active object after duplication of '{original_obj.name}'"
+    copy_obj = None
+    try:
+        # Copy the object directly rather than via duplicate_move_linked: the
+        # operator syncs selection, re-evaluates the depsgraph and pushes an
+        # undo step, none of which an export copy needs. The copy shares the
+        # original's data (a linked duplicate) until made single user below.
+        copy_obj = original_obj.copy()
+        collections = original_obj.users_collection or (context.collection,)
+        for collection in collections:
+            collection.objects.link(copy_obj)
+
+        logger.info(f"Successfully created duplicate '{copy_obj.name}'.")
+
+        # Make data single user FIRST for curves/metaballs to ensure
+        # we don't affect the original
+        if copy_obj.type in ["CURVE", "META"]:
+            if copy_obj.data and copy_obj.data.users > 1:
+                logger.info(
+                    f"Making {copy_obj.type.lower()} data single user "
+                    f"for '{copy_obj.name}'"
                 )
-
-            logger.info(
-                f"Successfully created duplicate '{copy_obj.name}' via operator."
-            )
-
-            # Make data single user FIRST for curves/metaballs to ensure
-            # we don't affect the original
-            if copy_obj and copy_obj.type in ["CURVE", "META"]:
-                if copy_obj.data and copy_obj.data.users > 1:
-                    logger.info(
-                        f"Making {copy_obj.type.lower()} data single user "
-                        f"for '{copy_obj.name}'"
-                    )
-                    copy_obj.data = copy_obj.data.copy()
-                # Now convert to mesh - this returns a new object
-                copy_obj = convert_curve_to_mesh_object(copy_obj, context)
-
-            # Make Mesh Data Single User (for regular meshes or after conversion)
-            if copy_obj and copy_obj.data and copy_obj.data.users > 1:
-                logger.info(f"Making mesh data single user for '{copy_obj.name}'")
                 copy_obj.data = copy_obj.data.copy()
+            # Now convert to mesh - this returns a new object
+            copy_obj = convert_curve_to_mesh_object(copy_obj, context)
 
-                # Optimise memory for large meshes after making single user
-                optimise_for_large_mesh(copy_obj)
+        # Make Mesh Data Single User (for regular meshes or after conversion)
+        if copy_obj and copy_obj.data and copy_obj.data.users > 1:
+            logger.info(f"Making mesh data single user for '{copy_obj.name}'")
+            copy_obj.data = copy_obj.data.copy()
 
-            return copy_obj, temp_metaball_mesh
+            # Optimise memory for large meshes after making single user
+            optimise_for_large_mesh(copy_obj)
 
-        except Exception as e:
-            logger.error(
-                f"Error using duplicate_move_linked operator for "
-                f"'{original_obj.name}': {e}",
-                exc_info=True,
-            )
-            # Attempt cleanup if copy_obj was created but failed later
-            copy_obj_ref = None
+        return copy_obj, temp_metaball_mesh
+
+    except Exception as e:
+        logger.error(
+            f"Error duplicating '{original_obj.name}': {e}",
+            exc_info=True,
+        )
+        # Attempt cleanup if copy_obj was created but failed later
+        if copy_obj is not None:
             try:
-                copy_obj_ref = context.view_layer.objects.active
-                if copy_obj_ref and copy_obj_ref != original_obj:
-                    logger.info(
-                        f"Attempting cleanup of partially created "
-                        f"copy: {copy_obj_ref.name}"
-                    )
-                    bpy.data.objects.remove(copy_obj_ref, do_unlink=True)
+                logger.info(
+                    f"Attempting cleanup of partially created copy: {copy_obj.name}"
+                )
+                bpy.data.objects.remove(copy_obj, do_unlink=True)
             except Exception as cleanup_e:
                 logger.warning(f"Issue during cleanup after copy failure: {cleanup_e}")
 
-            raise RuntimeError(
-                f"Failed to create operator copy of {original_obj.name}: {e}"
-            ) from e
+        raise RuntimeError(
+            f"Failed to create copy of {original_obj.name}: {e}"
+        ) from e
 
 
 def sanitise_filename(name: str) -> str:
@@ -1476,13 +1833,13 @@ def sanitise_filename(name: str) -> str:
         >>> sanitise_filename("object:2")
         'object_2'
     """
-    # Character class [\\/:*?"<>|.] matches all filesystem-illegal characters:
+    # The table maps all filesystem-illegal characters:
     # \ (backslash), / (forward slash), : (colon), * (asterisk),
     # ? (question mark), " (quote), < (less-than), > (greater-than),
     # | (pipe), . (period)
-    # All are replaced with underscore for cross-platform compatibility
-    sanitised = re.sub(r'[\\/:*?"<>|.]', "_", name)
-    return sanitised
+    # All are replaced with underscore for cross-platform compatibility.
+    # str.translate is a single C-level pass with no regex engine involved
+    return name.translate(FILENAME_ILLEGAL_CHARS_TABLE)
 
 
 def apply_naming_convention(name: str, convention: str) -> str:
@@ -1722,6 +2079,46 @@ def get_batch_export_filename(
     return final_name
 
 
+def compute_export_name(original_obj_name, scene_props, lod_level=None):
+    """
+    Build an export object's name from the naming settings, without touching it.
+
+    Args:
+        original_obj_name (str): The original name of the object.
+        scene_props (bpy.types.PropertyGroup): Scene properties for export.
+        lod_level (int, optional): LOD level for naming. Defaults to None.
+
+    Returns:
+        tuple: (final_name, base_name). ``final_name`` carries the ``_LODnn``
+        suffix when ``lod_level`` is given; ``base_name`` never does.
+    """
+    # Remove any existing LOD suffix if re-processing the same object
+    original_obj_name = original_obj_name.partition("_LOD")[0]
+
+    # Resolve naming settings (gated by the naming-enabled toggle)
+    prefix, suffix, convention = resolve_naming(scene_props)
+
+    # Apply naming convention (this handles sanitisation internally)
+    original_obj_name = apply_naming_convention(original_obj_name, convention)
+
+    # Apply prefix and suffix
+    base_name = f"{prefix}{original_obj_name}{suffix}"
+
+    # Truncate if name too long to avoid filesystem issues
+    if len(base_name) > MAX_FILENAME_LENGTH:
+        suffix_len = len(FILENAME_TRUNCATE_SUFFIX)
+        truncated = (
+            base_name[: MAX_FILENAME_LENGTH - suffix_len] + FILENAME_TRUNCATE_SUFFIX
+        )
+        logger.warning("Name too long, truncating: %s → %s", base_name, truncated)
+        base_name = truncated
+
+    final_name = (
+        f"{base_name}_LOD{lod_level:02d}" if lod_level is not None else base_name
+    )
+    return final_name, base_name
+
+
 def setup_export_object(
     obj,
     original_obj_name,
@@ -1752,53 +2149,25 @@ def setup_export_object(
     if not obj:
         return None, None
     try:
-        # Remove any existing LOD suffix if re-processing the same object
-        if "_LOD" in original_obj_name:
-            original_obj_name = original_obj_name.split("_LOD")[0]
-
-        # Resolve naming settings (gated by the naming-enabled toggle)
-        prefix, suffix, convention = resolve_naming(scene_props)
-
-        # Apply naming convention (this handles sanitisation internally)
-        original_obj_name = apply_naming_convention(original_obj_name, convention)
-
-        # Apply prefix and suffix
-        base_name = prefix + original_obj_name + suffix
-
-        # Truncate if name too long to avoid filesystem issues
-        if len(base_name) > MAX_FILENAME_LENGTH:
-            suffix_len = len(FILENAME_TRUNCATE_SUFFIX)
-            truncated = (
-                base_name[: MAX_FILENAME_LENGTH - suffix_len] + FILENAME_TRUNCATE_SUFFIX
-            )
-            logger.warning(f"Name too long, truncating: {base_name} → {truncated}")
-            base_name = truncated
-
-        final_name = (
-            f"{base_name}_LOD{lod_level:02d}" if lod_level is not None else base_name
+        final_name, base_name = compute_export_name(
+            original_obj_name, scene_props, lod_level
         )
         obj.name = final_name
-        logger.info(f"Renamed to: {obj.name}")
+        logger.info("Renamed to: %s", obj.name)
 
         # Check if object's scale is already 1.0
         # Use epsilon comparison to account for floating-point precision errors
-        scale_epsilon = (
-            1e-6  # 0.000001 - well below human-perceptible scale differences
-        )
-        if (
-            abs(obj.scale[0] - 1.0) > scale_epsilon
-            or abs(obj.scale[1] - 1.0) > scale_epsilon
-            or abs(obj.scale[2] - 1.0) > scale_epsilon
-        ):
+        s = obj.scale
+        if (s.x - 1.0) ** 2 + (s.y - 1.0) ** 2 + (s.z - 1.0) ** 2 > SCALE_EPSILON_SQ:
             # Apply scale transform if not 1.0
-            logger.info(f"Object scale is not 1.0: {obj.scale}, applying...")
+            logger.info("Object scale is not 1.0: %s, applying...", s)
             apply_transforms(obj, apply_scale=True)
 
         # Zero location if specified in scene properties
         # Skip for batch exports to preserve spatial relationships
         if scene_props.mesh_export_zero_location and not skip_zero_location:
             obj.location = (0.0, 0.0, 0.0)
-            logger.info(f"Zeroed location for {obj.name}")
+            logger.info("Zeroed location for %s", obj.name)
 
         # Calculate final scale factor but DON'T apply it to mesh data
         # This avoids memory-intensive vertex transformations
@@ -1807,22 +2176,23 @@ def setup_export_object(
             # Apply conversion factor for Metres (Blender default) to Centimetres
             final_scale_factor *= METERS_TO_CENTIMETERS
             logger.info(
-                f"Export scale factor: {final_scale_factor:.2f} "
-                f"(includes M to CM conversion)"
+                "Export scale factor: %.2f (includes M to CM conversion)",
+                final_scale_factor,
             )
         else:
-            logger.info(f"Export scale factor: {final_scale_factor:.2f}")
+            logger.info("Export scale factor: %.2f", final_scale_factor)
 
         # For GLTF and USD, apply scale to object transform instead of
         # passing to exporter. This avoids potential exporter parameter
         # issues whilst maintaining zero performance cost
         if scene_props.mesh_export_format in ["GLTF", "USD"]:
-            if abs(final_scale_factor - 1.0) > 1e-6:
+            if (final_scale_factor - 1.0) ** 2 > SCALE_EPSILON_SQ:
                 # Set object-level scale (zero-cost, no mesh vertex transformation)
                 obj.scale = (final_scale_factor, final_scale_factor, final_scale_factor)
                 logger.info(
-                    f"Applied {final_scale_factor}x scale to object "
-                    f"transform for {scene_props.mesh_export_format}"
+                    "Applied %sx scale to object transform for %s",
+                    final_scale_factor,
+                    scene_props.mesh_export_format,
                 )
                 final_scale_factor = (
                     1.0  # Don't pass to exporter, already applied to object
@@ -1897,8 +2267,16 @@ def apply_transforms(
     )
 
     try:
-        # Get current matrix components
-        loc, rot, scale = obj.matrix_world.decompose()
+        # mesh.transform() edits the datablock in place, so never bake into mesh
+        # data shared with another object (e.g. the user's original).
+        if obj.data.users > 1:
+            logger.info(f"Making mesh data single user for '{obj.name}'")
+            obj.data = obj.data.copy()
+
+        # Decompose the local (basis) matrix, matching what Blender's own
+        # transform_apply bakes. matrix_world would also fold in the parent's
+        # transform, which the parent then applies a second time.
+        loc, rot, scale = obj.matrix_basis.decompose()
 
         # Build transform matrix from only the components we want to apply
         transform_matrix = Matrix.Identity(4)
@@ -1972,26 +2350,121 @@ def bake_fbx_export_space(obj, axis_forward, axis_up, export_scale):
     if not obj or obj.type != "MESH" or not obj.data:
         return
 
-    # If forward and up land on the same axis (a degenerate combo the FBX export
-    # operator silently auto-corrects via orientation_helper), apply Blender's own
-    # resolution rule - bump the up axis to the next one - so axis_conversion doesn't
-    # raise and we match what the exporter would have done
-    # (bpy_extras.axis_conversion_ensure).
+    # Combine the axis conversion with the uniform export scale into a single
+    # bake matrix.
+    m_bake = export_axis_matrix(axis_forward, axis_up) @ Matrix.Scale(export_scale, 4)
+
+    obj.data.transform(m_bake)
+    obj.data.update()
+
+
+def export_axis_matrix(axis_forward, axis_up):
+    """
+    Build the 4x4 matrix mapping Blender's space to the chosen export axes.
+
+    If forward and up land on the same axis (a degenerate combo the export
+    operators silently auto-correct via orientation_helper), Blender's own
+    resolution rule is applied - bump the up axis to the next one - so
+    axis_conversion doesn't raise and the result matches what the exporter
+    would have done (bpy_extras.axis_conversion_ensure).
+
+    Args:
+        axis_forward (str): Target forward axis (e.g. "-Z")
+        axis_up (str): Target up axis (e.g. "Y")
+
+    Returns:
+        mathutils.Matrix: 4x4 rotation from Blender (Y forward, Z up) space
+    """
     if axis_forward[-1] == axis_up[-1]:
         axis_up = axis_up[:-1] + "XYZ"[("XYZ".index(axis_up[-1]) + 1) % 3]
-
-    # axis_conversion maps Blender's native space (Y forward, Z up) to the chosen
-    # FBX axes; combine with the uniform export scale into a single bake matrix.
-    m_axis = axis_conversion(
+    return axis_conversion(
         from_forward="Y",
         from_up="Z",
         to_forward=axis_forward,
         to_up=axis_up,
     ).to_4x4()
-    m_bake = m_axis @ Matrix.Scale(export_scale, 4)
 
-    obj.data.transform(m_bake)
-    obj.data.update()
+
+def write_stl_binary(
+    filepath, axis_forward="Y", axis_up="Z", global_scale=1.0, background=False
+):
+    """
+    Write the selected mesh objects to a binary STL file using NumPy.
+
+    Stands in for ``bpy.ops.wm.stl_export(export_selected_objects=True,
+    apply_modifiers=False)``: export copies already have their modifiers
+    applied, so the triangles are read straight from each mesh with
+    ``foreach_get``, transformed in one matrix product and written as a single
+    packed record array - no operator call or per-triangle Python work.
+
+    Args:
+        filepath (str): Output path of the STL file
+        axis_forward (str): Target forward axis (e.g. "-Z")
+        axis_up (str): Target up axis (e.g. "Y")
+        global_scale (float): Uniform scale applied to the written coordinates
+        background (bool): Write the file on a worker thread. Nothing exists
+            at ``filepath`` until the write completes; callers must call
+            flush_background_writes() to wait for it and collect failures
+
+    Returns:
+        set: ``{"FINISHED"}``, matching the operator it replaces
+    """
+    m_export = export_axis_matrix(axis_forward, axis_up) @ Matrix.Scale(
+        global_scale, 4
+    )
+    # Evaluated matrices: location/rotation edits made during setup are only
+    # reflected in matrix_world once the depsgraph has been updated
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+
+    chunks = []
+    for obj in bpy.context.selected_objects:
+        if obj.type != "MESH" or not obj.data:
+            continue
+        mesh = obj.data
+        mesh.calc_loop_triangles()
+        tri_count = len(mesh.loop_triangles)
+        if not tri_count:
+            continue
+
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        tri_verts = np.empty(tri_count * 3, dtype=np.int32)
+        mesh.loop_triangles.foreach_get("vertices", tri_verts)
+
+        matrix = np.array(
+            m_export @ obj.evaluated_get(depsgraph).matrix_world, dtype=np.float32
+        )
+        co = co.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+        chunks.append(co[tri_verts].reshape(-1, 3, 3))
+
+    tris = np.concatenate(chunks) if chunks else np.empty((0, 3, 3), np.float32)
+
+    # Facet normals from the transformed triangles (zero for degenerate ones)
+    normals = np.cross(tris[:, 1] - tris[:, 0], tris[:, 2] - tris[:, 0])
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    np.divide(normals, lengths, out=normals, where=lengths > 0)
+
+    records = np.zeros(len(tris), dtype=STL_TRIANGLE_DTYPE)
+    records["normal"] = normals
+    records["vertices"] = tris
+
+    if background:
+        # The records are a plain NumPy buffer with no bpy references, so the
+        # write overlaps with preparing the next object
+        _submit_background_write(filepath, _write_stl_file, filepath, records)
+    else:
+        _write_stl_file(filepath, records)
+
+    return {"FINISHED"}
+
+
+def _write_stl_file(filepath: str, records) -> None:
+    """Write packed STL triangle records, renaming the file into place when done."""
+    with atomic_write_path(filepath) as write_path, open(write_path, "wb") as f:
+        f.write(STL_HEADER)
+        f.write(len(records).to_bytes(4, "little"))
+        # Byte view of the record array: written without copying it
+        f.write(memoryview(records.view(np.uint8)))
 
 
 def apply_mesh_modifiers(obj, modifier_mode="VISIBLE"):
@@ -2010,350 +2483,151 @@ def apply_mesh_modifiers(obj, modifier_mode="VISIBLE"):
 
     # Skip all modifier application if mode is NONE
     if modifier_mode == "NONE":
-        logger.info(f"Skipping modifier application for {obj.name} (mode: NONE)")
+        logger.info("Skipping modifier application for %s (mode: NONE)", obj.name)
         return
 
-    logger.info(f"Applying {modifier_mode.lower()} modifiers for {obj.name}...")
-    current_mode = obj.mode
-    MeshOperations.safe_mode_set(obj, "OBJECT")
+    # Nothing to bake: skip the stack partitioning entirely
+    if not obj.modifiers:
+        logger.info("No modifiers to apply for %s", obj.name)
+        return
 
-    override = bpy.context.copy()
-    override["object"] = obj
-    override["active_object"] = obj
-    override["selected_objects"] = [obj]
-    override["selected_editable_objects"] = [obj]
-    applied_modifiers = []
-    poly_count = len(obj.data.polygons)
-    is_large_mesh = poly_count > LARGE_MESH_THRESHOLD
+    logger.info("Applying %s modifiers for %s...", modifier_mode.lower(), obj.name)
 
-    try:
-        for modifier in obj.modifiers[:]:  # Iterate over a copy
-            should_apply = False
-
-            # Determine if we should apply this modifier based on mode
-            if modifier_mode == "VISIBLE":
-                should_apply = modifier.show_viewport
-            elif modifier_mode == "RENDER":
-                should_apply = modifier.show_render
-
-            if should_apply:
-                mod_name = modifier.name
-                logger.info(f"Applying modifier: {mod_name} ({modifier_mode.lower()})")
-                try:
-                    with bpy.context.temp_override(**override):
-                        bpy.ops.object.modifier_apply(modifier=mod_name)
-                    applied_modifiers.append(mod_name)
+    # Partition the stack once, by name, so no live modifier references are
+    # held across the bake. The evaluated depsgraph only honours show_viewport,
+    # so it is lined up with the selection for the bake and restored afterwards
+    attr = "show_viewport" if modifier_mode == "VISIBLE" else "show_render"
+    viewport_state = []  # [(modifier name, original show_viewport)]
+    wanted = []
+    skipped = []
+    for modifier in obj.modifiers:
+        viewport_state.append((modifier.name, modifier.show_viewport))
+        (wanted if getattr(modifier, attr) else skipped).append(modifier.name)
 
-                    # Memory cleanup for large meshes after every 3 modifiers
-                    if is_large_mesh and len(applied_modifiers) % 3 == 0:
-                        MeshOperations.update_mesh_data(obj, with_memory_cleanup=True)
-                        logger.info(
-                            f"Memory cleanup after {len(applied_modifiers)} modifiers"
-                        )
+    if skipped:
+        logger.info(
+            "Skipping modifiers (%s disabled): %s",
+            "viewport" if modifier_mode == "VISIBLE" else "render",
+            ", ".join(skipped),
+        )
+    if not wanted:
+        # Every modifier is disabled for this mode: no bake, and no
+        # show_viewport toggling to undo
+        logger.info("No %s modifiers to apply for %s", modifier_mode.lower(), obj.name)
+        return
 
-                except (RuntimeError, ReferenceError) as e:
-                    logger.warning(
-                        f"Could not apply modifier '{mod_name}' on {obj.name}: {e}"
-                    )
-            else:
-                status = (
-                    "viewport disabled"
-                    if modifier_mode == "VISIBLE"
-                    else "render disabled"
-                )
-                logger.info(f"Skipping modifier '{modifier.name}': {status}")
+    applied_modifiers = []
+    modifiers = obj.modifiers
+
+    try:
+        for mod_name in wanted:
+            modifiers[mod_name].show_viewport = True
+        for mod_name in skipped:
+            modifiers[mod_name].show_viewport = False
+
+        # Bake the whole stack in one evaluation instead of one
+        # modifier_apply (and depsgraph update) per modifier
+        MeshOperations.bake_evaluated_mesh(obj)
+
+        for mod_name in wanted:
+            modifiers.remove(modifiers[mod_name])
+            applied_modifiers.append(mod_name)
+            logger.info("Applied modifier: %s (%s)", mod_name, modifier_mode.lower())
+
+    except (RuntimeError, ReferenceError) as e:
+        logger.warning("Could not apply modifiers on %s: %s", obj.name, e)
     finally:
-        if obj.mode != current_mode:
-            bpy.ops.object.mode_set(mode=current_mode)
-    logger.info(f"Finished applying modifiers. Applied: {applied_modifiers}")
+        for mod_name, show_viewport in viewport_state:
+            mod = modifiers.get(mod_name)
+            if mod:  # Applied modifiers are gone from the stack
+                mod.show_viewport = show_viewport
+    logger.info("Finished applying modifiers. Applied: %s", applied_modifiers)
 
 
-def compress_textures(obj, ratio, export_path=None, save_compressed=True):
+def read_image_pixels(img):
     """
-    Compresses textures based on decimation ratio with no user input required.
+    Read an image's pixels into a NumPy array in one bulk copy.
+
+    ``foreach_get`` copies straight into the typed buffer instead of creating
+    a Python float per channel value. A fresh array is returned per image, as
+    callers hold several buffers at once while resampling on worker threads.
 
     Args:
-        obj:    The mesh object whose textures should be compressed
-        ratio:  The decimation ratio
-                1.0 = full quality, 0.01 = heavy decimation
-        export_path: Directory to save compressed textures to
-        save_compressed: Whether to save compressed textures to disk
+        img (bpy.types.Image): Image with loaded pixel data
 
     Returns:
-        List of modified image names for reporting
+        numpy.ndarray: Flat float32 buffer of width * height * channels values
     """
-    if not obj or obj.type != "MESH":
-        return []
+    width, height = img.size
+    pixels = np.empty(width * height * img.channels, dtype=np.float32)
+    img.pixels.foreach_get(pixels)
+    return pixels
 
-    logger.info(
-        f"Compressing textures for {obj.name} (decimation ratio: {ratio:.3f})..."
-    )
 
-    # Get all materials on the object
-    materials = obj.data.materials
-    if not materials:
-        logger.info(f"No materials found on {obj.name}, skipping texture compression")
-        return []
-
-    logger.info(f"Found {len(materials)} materials on {obj.name}")
-
-    modified_images = []
-
-    # First pass - collect all unique images and nodes using them
-    image_nodes = {}  # {image: [nodes using this image]}
-    for mat in materials:
-        if not mat or not mat.node_tree:
-            continue
-
-        # Find all image texture nodes in the material
-        for node in mat.node_tree.nodes:
-            if node.type == "TEX_IMAGE" and node.image:
-                if node.image not in image_nodes:
-                    image_nodes[node.image] = []
-                image_nodes[node.image].append((mat, node))
-
-    # Nothing to do if no images found
-    if not image_nodes:
-        logger.info(f"No texture images found on {obj.name}")
-        return []
-
-    logger.info(f"Found {len(image_nodes)} unique texture images to compress")
-
-    # Calculate compression amount based on decimation ratio
-    compression_factor = max(ratio**0.9, 0.05)  # Limit max compression to 1/20
-    min_dimension = 64  # Minimum texture size
-
-    # Process each image
-    for orig_img, nodes_using_img in image_nodes.items():
-        try:
-            # Skip packed, or invalid images
-            if not orig_img.has_data or orig_img.size[0] == 0 or orig_img.size[1] == 0:
-                logger.debug(f"Skipping {orig_img.name}: invalid or no data")
-                continue
-
-            # Skip already compressed images
-            # (but allow recompression if different ratio)
-            if orig_img.name.endswith("_LOD"):
-                logger.debug(f"Skipping {orig_img.name}: already compressed")
-                continue
-
-            # Calculate new resolution
-            orig_width, orig_height = orig_img.size
-            is_power_of_2 = (orig_width & (orig_width - 1) == 0) and (
-                orig_height & (orig_height - 1) == 0
-            )
-
-            new_width = max(int(orig_width * compression_factor), min_dimension)
-            new_height = max(int(orig_height * compression_factor), min_dimension)
-
-            # Round to power of 2 if original was power of 2
-            if is_power_of_2:
-                new_width = 2 ** max(0, (new_width - 1).bit_length())
-                new_height = 2 ** max(0, (new_height - 1).bit_length())
-
-            # Skip if size hasn't changed
-            if (new_width, new_height) == (orig_width, orig_height):
-                continue
-
-            # Create a copy of the original image with unique name based on ratio
-            ratio_suffix = f"{int(ratio * 100):02d}"  # Convert 0.75 to "75"
-            copy_name = f"{orig_img.name}_LOD{ratio_suffix}"
-
-            # Check if copy already exists, reuse if it does
-            copied_img = bpy.data.images.get(copy_name)
-            if copied_img:
-                # If dimensions don't match our target, recreate it
-                if copied_img.size[0] != new_width or copied_img.size[1] != new_height:
-                    bpy.data.images.remove(copied_img)
-                    copied_img = None
-
-            if not copied_img:
-                # Create new image with proper dimensions
-                copied_img = bpy.data.images.new(
-                    name=copy_name,
-                    width=new_width,
-                    height=new_height,
-                    alpha=True
-                    if hasattr(orig_img, "alpha") and orig_img.alpha
-                    else False,
-                    float_buffer=orig_img.is_float
-                    if hasattr(orig_img, "is_float")
-                    else False,
-                )
-
-                # Copy pixel data from original and resize using a more reliable method
-                if orig_img.has_data and len(orig_img.pixels) > 0:
-                    try:
-                        # Ensure original image is loaded and packed
-                        if not orig_img.packed_file and orig_img.filepath:
-                            orig_img.reload()
-
-                        # Use a different approach: create at target size
-                        # and use GPU for scaling
-                        # First, save original to a temporary location
-                        # if it has a filepath
-                        import tempfile
-
-                        if orig_img.filepath and os.path.exists(
-                            bpy.path.abspath(orig_img.filepath)
-                        ):
-                            # Use the existing file
-                            source_path = bpy.path.abspath(orig_img.filepath)
-                            # Load the image into the new image and scale it
-                            copied_img.filepath_raw = source_path
-                            copied_img.reload()
-
-                            # Now scale to target size
-                            copied_img.scale(new_width, new_height)
-                        else:
-                            # Image is procedural or packed, save it temporarily
-                            temp_file = tempfile.NamedTemporaryFile(
-                                suffix=".png", delete=False
-                            )
-                            temp_file.close()
-
-                            with temporary_image_file(temp_file.name) as temp_path:
-                                # Save the original image to temp file
-                                orig_img.filepath_raw = temp_path
-                                orig_img.file_format = "PNG"
-                                orig_img.save()
-
-                                # Load the image into the new image and scale it
-                                copied_img.filepath_raw = temp_path
-                                copied_img.reload()
-
-                                # Now scale to target size
-                                copied_img.scale(new_width, new_height)
-
-                        # Copy other relevant properties
-                        copied_img.colorspace_settings.name = (
-                            orig_img.colorspace_settings.name
-                        )
-
-                    except Exception as e:
-                        logger.warning(f"Error copying pixels for {orig_img.name}: {e}")
-                        # Clean up failed copy
-                        if copied_img:
-                            bpy.data.images.remove(copied_img)
-                        continue
-
-                logger.info(
-                    f"Created compressed copy of '{orig_img.name}' "
-                    f"at {new_width}x{new_height} "
-                    f"(compression factor: {compression_factor:.2f})"
-                )
-
-                # Save compressed texture to disk if requested
-                if save_compressed and export_path:
-                    try:
-                        # Determine file extension from original
-                        orig_ext = ".jpg"  # Default
-                        if orig_img.filepath:
-                            orig_ext = os.path.splitext(orig_img.filepath)[1] or ".jpg"
-                        elif "." in orig_img.name:
-                            orig_ext = "." + orig_img.name.split(".")[-1]
-
-                        # Create compressed texture filename
-                        base_name = os.path.splitext(orig_img.name)[0]
-                        compressed_filename = f"{base_name}_LOD{ratio_suffix}{orig_ext}"
-                        compressed_filepath = os.path.join(
-                            export_path, compressed_filename
-                        )
-
-                        # Save the compressed texture
-                        copied_img.filepath_raw = compressed_filepath
-                        copied_img.file_format = (
-                            "JPEG" if orig_ext.lower() in [".jpg", ".jpeg"] else "PNG"
-                        )
-                        copied_img.save()
-
-                        logger.info(f"Saved compressed texture: {compressed_filename}")
-
-                    except Exception as save_e:
-                        logger.warning(
-                            f"Failed to save compressed texture {copy_name}: {save_e}"
-                        )
-
-            # Update material nodes to use the copied image
-            for mat, node in nodes_using_img:
-                node.image = copied_img
-                logger.debug(
-                    f"Updated node '{node.name}' in material '{mat.name}' "
-                    f"to use compressed image"
-                )
-
-            modified_images.append(
-                f"{orig_img.name} ({orig_width}x{orig_height} "
-                f"→ {new_width}x{new_height})"
-            )
-
-            # Store original image reference on the object for restoration
-            if "original_textures" not in obj:
-                obj["original_textures"] = {}
-
-            obj["original_textures"][copy_name] = orig_img.name
-
-        except Exception as e:
-            logger.error(
-                f"Error processing texture {orig_img.name}: {e}", exc_info=True
-            )
-            continue
-
-    return modified_images
+def _linear_sample_positions(src_len, dst_len):
+    """Return (lower index, upper index, weight) for linear resampling one axis."""
+    # Pixel centres of the target mapped back onto the source axis
+    pos = (np.arange(dst_len, dtype=np.float32) + 0.5) * (src_len / dst_len) - 0.5
+    np.clip(pos, 0, src_len - 1, out=pos)
+    lower = pos.astype(np.intp)
+    upper = np.minimum(lower + 1, src_len - 1)
+    return lower, upper, pos - lower
 
 
-def restore_original_textures(obj):
+def downsample_pixels(pixels, width, height, new_width, new_height, channels=4):
     """
-    Restores original textures after exportby replacing
-    compressed copies with originals.
+    Resample a flat pixel buffer to new dimensions using NumPy.
+
+    The image is first box-filtered by the largest whole factor that does not
+    undershoot the target, which averages every source pixel into the result
+    (an exact area average for integer reductions such as power-of-two
+    downscales). Any remaining non-integer step, always less than 2x, is
+    interpolated linearly. Buffers with fewer than four channels are expanded
+    to RGBA, matching the layout of images created with ``bpy.data.images.new``.
 
     Args:
-        obj (bpy.types.Object): The object whose textures to restore.
+        pixels (numpy.ndarray): Flat float32 buffer as read by read_image_pixels
+        width (int): Source width in pixels
+        height (int): Source height in pixels
+        new_width (int): Target width in pixels
+        new_height (int): Target height in pixels
+        channels (int): Number of channels per pixel in ``pixels``
 
     Returns:
-        None
+        numpy.ndarray: Flat, contiguous float32 RGBA buffer of the new size
     """
-    if not obj or obj.type != "MESH" or "original_textures" not in obj:
-        return
-
-    texture_map = obj.get("original_textures", {})
-    if not texture_map:
-        return
-
-    logger.info(f"Restoring original textures for {obj.name}...")
-
-    # Get all materials on the object
-    materials = obj.data.materials
-    if not materials:
-        return
-
-    # Find all image texture nodes and restore originals
-    for mat in materials:
-        if not mat or not mat.node_tree:
-            continue
-
-        for node in mat.node_tree.nodes:
-            if node.type == "TEX_IMAGE" and node.image:
-                # Check if this is an LOD image that needs restoration
-                if node.image.name in texture_map:
-                    original_name = texture_map[node.image.name]
-                    original_img = bpy.data.images.get(original_name)
+    dst = pixels.reshape(height, width, channels)
+
+    # Box filter: average each (block_h x block_w) tile. Up to block - 1
+    # trailing rows/columns that do not fill a whole tile are dropped
+    block_h = max(1, height // new_height)
+    block_w = max(1, width // new_width)
+    if block_h > 1 or block_w > 1:
+        box_h = height // block_h
+        box_w = width // block_w
+        dst = (
+            dst[: box_h * block_h, : box_w * block_w]
+            .reshape(box_h, block_h, box_w, block_w, channels)
+            .mean(axis=(1, 3))
+        )
 
-                    if original_img:
-                        logger.info(f"Restoring {node.image.name} → {original_name}")
-                        node.image = original_img
+    # Linear interpolation for the remaining fractional step
+    if dst.shape[0] != new_height:
+        lower, upper, weight = _linear_sample_positions(dst.shape[0], new_height)
+        weight = weight[:, None, None]
+        dst = dst[lower] * (1.0 - weight) + dst[upper] * weight
+    if dst.shape[1] != new_width:
+        lower, upper, weight = _linear_sample_positions(dst.shape[1], new_width)
+        weight = weight[None, :, None]
+        dst = dst[:, lower] * (1.0 - weight) + dst[:, upper] * weight
 
-    # Clean up the mapping
-    del obj["original_textures"]
+    if channels == 1:
+        dst = np.repeat(dst, 3, axis=2)
+    if dst.shape[2] == 3:
+        alpha = np.ones(dst.shape[:2] + (1,), dtype=dst.dtype)
+        dst = np.concatenate((dst, alpha), axis=2)
 
-    # Delete any unused LOD textures
-    try:
-        for img in list(bpy.data.images):  # Use list to avoid iteration issues
-            if "_LOD" in img.name and img.users == 0:
-                logger.debug(f"Removing unused LOD texture: {img.name}")
-                bpy.data.images.remove(img)
-    except Exception as e:
-        logger.warning(f"Error cleaning up LOD textures: {e}")
+    return np.ascontiguousarray(dst, dtype=np.float32).ravel()
 
 
 def apply_decimate_modifier(obj, ratio, decimate_type, sym_axis="X", sym=False):
@@ -2376,17 +2650,16 @@ def apply_decimate_modifier(obj, ratio, decimate_type, sym_axis="X", sym=False):
     # Get initial poly count for logging
     initial_poly_count = len(obj.data.polygons)
     logger.info(
-        f"Applying Decimate to mesh with {initial_poly_count:,} polygons "
-        f"(Ratio: {ratio:.3f}, Type: {decimate_type})..."
+        "Applying Decimate to mesh with %d polygons (Ratio: %.3f, Type: %s)...",
+        initial_poly_count,
+        ratio,
+        decimate_type,
     )
 
     # Memory optimisation for very large meshes before decimation
     if initial_poly_count > VERY_LARGE_MESH_THRESHOLD:
         logger.info("Very large mesh detected, enabling memory optimisation")
-        MeshOperations.update_mesh_data(obj, with_memory_cleanup=True)
-
-    current_mode = obj.mode
-    MeshOperations.safe_mode_set(obj, "OBJECT")
+        MemoryManager.request_cleanup(poly_count=initial_poly_count)
 
     # Texture compression disabled - using simple external texture saving instead
     logger.debug("Skipping texture compression - using external texture saving")
@@ -2407,55 +2680,66 @@ def apply_decimate_modifier(obj, ratio, decimate_type, sym_axis="X", sym=False):
             axis_upper = sym_axis.upper()
             if axis_upper not in {"X", "Y", "Z"}:
                 logger.error(
-                    f"Invalid symmetry axis value received: "
-                    f"{sym_axis}. Aborting modifier application."
+                    "Invalid symmetry axis value received: "
+                    "%s. Aborting modifier application.",
+                    sym_axis,
                 )
                 obj.modifiers.remove(dec_mod)  # Clean up modifier
                 raise ValueError(f"Invalid symmetry axis: {sym_axis}")
 
             dec_mod.symmetry_axis = axis_upper
-            logger.info(f"Using symmetry axis: {axis_upper}")
-
-    override = bpy.context.copy()
-    override["object"] = obj
-    override["active_object"] = obj
-    override["selected_objects"] = [obj]
-    override["selected_editable_objects"] = [obj]
+            logger.info("Using symmetry axis: %s", axis_upper)
 
     try:
-        with bpy.context.temp_override(**override):
-            bpy.ops.object.modifier_apply(modifier=mod_name)
-
-        # Log final results
-        final_poly_count = len(obj.data.polygons)
-        actual_ratio = (
-            final_poly_count / initial_poly_count if initial_poly_count > 0 else 0
-        )
-        logger.info(
-            f"Decimation complete: {initial_poly_count} "
-            f"→ {final_poly_count} polys "
-            f"(target: {ratio:.3f}, actual: {actual_ratio:.3f})"
-        )
-
-        # No texture compression details to log
-        pass
+        # Bake the evaluated mesh directly rather than paying for
+        # modifier_apply's undo push and selection sync on every LOD level.
+        # Any other modifiers still on the stack (apply mode NONE) are hidden
+        # from the evaluation so only the decimate is baked into the base
+        # mesh, as modifier_apply would, then shown again
+        hidden = [
+            mod.name
+            for mod in obj.modifiers
+            if mod.name != mod_name and mod.show_viewport
+        ]
+        for name in hidden:
+            obj.modifiers[name].show_viewport = False
+        try:
+            MeshOperations.bake_evaluated_mesh(obj)
+        finally:
+            for name in hidden:
+                obj.modifiers[name].show_viewport = True
+        obj.modifiers.remove(dec_mod)
+
+        # Log final results (the count is only read for this message)
+        if logger.isEnabledFor(logging.INFO):
+            final_poly_count = len(obj.data.polygons)
+            actual_ratio = (
+                final_poly_count / initial_poly_count if initial_poly_count > 0 else 0
+            )
+            logger.info(
+                "Decimation complete: %d → %d polys (target: %.3f, actual: %.3f)",
+                initial_poly_count,
+                final_poly_count,
+                ratio,
+                actual_ratio,
+            )
 
     except Exception as e:
-        logger.error(f"Failed to apply Decimate modifier: {e}")
+        logger.error("Failed to apply Decimate modifier: %s", e)
         if mod_name in obj.modifiers:
             try:
                 obj.modifiers.remove(dec_mod)
             except (ReferenceError, RuntimeError):
                 pass  # Modifier already gone or object invalid
         raise RuntimeError(f"Failed to apply Decimate modifier: {e}") from e
-    finally:
-        if obj.mode != current_mode:
-            bpy.ops.object.mode_set(mode=current_mode)
 
 
 def triangulate_mesh(obj, method="BEAUTY", keep_normals=True):
     """
-    Add and apply a triangulate modifier.
+    Triangulate a mesh object.
+
+    Uses bmesh directly unless custom normals must be preserved, in which case
+    a Triangulate modifier is added and applied.
 
     Args:
         obj (bpy.types.Object): The object to triangulate.
@@ -2478,33 +2762,43 @@ def triangulate_mesh(obj, method="BEAUTY", keep_normals=True):
     poly_count = len(obj.data.polygons)
     logger.info(f"Triangulating {obj.name} with {poly_count:,} polygons...")
 
-    # Memory optimisation for large meshes before triangulation
+    # Memory optimisation for large meshes before triangulation (no mesh
+    # update: the triangulation below rebuilds the mesh data anyway)
     if poly_count > LARGE_MESH_THRESHOLD:
-        MeshOperations.update_mesh_data(obj, with_memory_cleanup=True)
+        MemoryManager.request_cleanup(poly_count=poly_count)
 
-    current_mode = obj.mode
-    MeshOperations.safe_mode_set(obj, "OBJECT")
+    mesh = obj.data
+    if not (keep_normals and mesh.has_custom_normals):
+        # No custom normals to preserve: triangulate the mesh data in place
+        # with bmesh, skipping the modifier/operator round trip entirely
+        bm = bmesh.new()
+        try:
+            bm.from_mesh(mesh)
+            bmesh.ops.triangulate(
+                bm,
+                faces=bm.faces[:],
+                quad_method=BMESH_QUAD_METHODS.get(method, "BEAUTY"),
+            )
+            bm.to_mesh(mesh)
+            mesh.update()
+            logger.info("Successfully triangulated.")
+        except Exception as e:
+            logger.warning(f"Could not triangulate {obj.name}: {e}")
+        finally:
+            bm.free()
+        return
 
     mod_name = "TempTriangulate"
     tri_mod = obj.modifiers.new(name=mod_name, type="TRIANGULATE")
     tri_mod.quad_method = method
     tri_mod.keep_custom_normals = keep_normals
 
-    override = bpy.context.copy()
-    override["object"] = obj
-    override["active_object"] = obj
-    override["selected_objects"] = [obj]
-    override["selected_editable_objects"] = [obj]
-
     try:
-        with bpy.context.temp_override(**override):
+        with bpy.context.temp_override(**MeshOperations.object_override(obj)):
             bpy.ops.object.modifier_apply(modifier=mod_name)
         logger.info("Successfully triangulated.")
     except Exception as e:
         logger.warning(f"Could not apply triangulation modifier on {obj.name}: {e}")
-    finally:
-        if obj.mode != current_mode:
-            bpy.ops.object.mode_set(mode=current_mode)
 
 
 def is_normal_map(node, img):
@@ -2519,33 +2813,27 @@ def is_normal_map(node, img):
         bool: True if likely a normal map
     """
     # Check node name
-    node_name_lower = node.name.lower()
-    if any(term in node_name_lower for term in ["normal", "norm", "nrm", "bump"]):
+    if NORMAL_MAP_NODE_NAME_RE.search(node.name):
         return True
 
     # Check image name
-    img_name_lower = img.name.lower()
-    if any(
-        term in img_name_lower
-        for term in ["normal", "norm", "nrm", "bump", "_n.", "_n_"]
-    ):
+    if NORMAL_MAP_IMAGE_NAME_RE.search(img.name):
         return True
 
+    # Collect the input sockets this node feeds, once, for both link checks
+    downstream = {
+        link.to_socket.name for output in node.outputs for link in output.links
+    }
+
     # Check if connected to Normal input
-    for output in node.outputs:
-        for link in output.links:
-            if link.to_socket.name.lower() in ["normal", "normal map"]:
-                return True
+    if any(name.lower() in NORMAL_MAP_SOCKET_NAMES for name in downstream):
+        return True
 
     # Check colorspace - normal maps are usually Non-Color
     if hasattr(img.colorspace_settings, "name"):
-        if img.colorspace_settings.name in ["Non-Color", "Linear", "Raw"]:
+        if img.colorspace_settings.name in NON_COLOR_COLORSPACES:
             # Additional check - if it's connected to Base Color, it's not a normal map
-            for output in node.outputs:
-                for link in output.links:
-                    if link.to_socket.name in ["Base Color", "Color"]:
-                        return False
-            return True
+            return downstream.isdisjoint(COLOR_SOCKET_NAMES)
 
     return False
 
@@ -2593,6 +2881,39 @@ def get_texture_format_info(img):
     return format_string, has_alpha, is_hdr
 
 
+def copyable_image_source(img, format_string, scene_props=None):
+    """
+    Return the image's source file if it can be copied verbatim on export.
+
+    That is the case for an unpacked, unmodified file-backed image whose file
+    extension already matches the format it would be saved as. JPEGs are only
+    copied when no export quality is requested, since saving re-encodes them
+    at ``mesh_export_texture_quality``.
+
+    Args:
+        img: The image data
+        format_string: Target file_format from get_texture_format_info
+        scene_props: Scene properties for texture settings
+
+    Returns:
+        str or None: Absolute source path, or None if the image must be saved
+    """
+    if (
+        img.source != "FILE"
+        or img.packed_file is not None
+        or img.is_dirty
+        or not img.filepath
+        or (format_string == "JPEG" and scene_props)
+    ):
+        return None
+
+    source_path = bpy.path.abspath(img.filepath, library=img.library)
+    ext = os.path.splitext(source_path)[1].lower()
+    if TEXTURE_EXTENSION_FORMATS.get(ext) != format_string:
+        return None
+    return source_path if os.path.isfile(source_path) else None
+
+
 def save_external_textures(
     obj, export_dir, lod_suffix="", resize_textures=True, scene_props=None
 ):
@@ -2608,250 +2929,688 @@ def save_external_textures(
         scene_props: Scene properties for texture settings
 
     Returns:
-        Tuple: (List of saved texture filenames, Dict of original node
-            references for restoration)
+        Tuple: (List of saved texture filenames, Dict of original
+            references for restoration - images map to their original
+            filepath_raw, nodes to their original image, List of images
+            loaded from the saved files)
     """
     if not obj or obj.type != "MESH":
-        return [], {}
+        return [], {}, []
 
     saved_textures = []
     original_references = {}  # Store original image references for restoration
+    # Images created by bpy.data.images.load, tracked by datablock because
+    # Blender may rename them (".001" suffix, 63-character limit)
+    loaded_images = []
     materials = obj.data.materials
 
     if not materials:
-        return saved_textures, original_references
+        return saved_textures, original_references, loaded_images
+
+    # Read texture settings once rather than through RNA for every image.
+    # lod_sizes is indexed by LOD level; LOD00 keeps the original size.
+    if scene_props:
+        preserve_normals = scene_props.mesh_export_preserve_normal_maps
+        texture_quality = scene_props.mesh_export_texture_quality
+        lod_sizes = (
+            None,
+            int(scene_props.mesh_export_lod1_texture_size),
+            int(scene_props.mesh_export_lod2_texture_size),
+            int(scene_props.mesh_export_lod3_texture_size),
+            int(scene_props.mesh_export_lod4_texture_size),
+        )
+    else:
+        preserve_normals = False
+        texture_quality = None
+        lod_sizes = (None,) * 5
+
+    lod_match = LOD_SUFFIX_RE.search(lod_suffix)
+    lod_level = int(lod_match.group(1)) if lod_match else None
+    if lod_level is not None and lod_level >= len(lod_sizes):
+        lod_level = None  # Unknown LOD level: default to original
 
     # Determine target texture size based on LOD level (only if resizing is enabled)
     target_size = None
-    if resize_textures and scene_props:
-        if "LOD00" in lod_suffix:
-            target_size = None  # Original size
-        elif "LOD01" in lod_suffix:
-            target_size = int(scene_props.mesh_export_lod1_texture_size)
-        elif "LOD02" in lod_suffix:
-            target_size = int(scene_props.mesh_export_lod2_texture_size)
-        elif "LOD03" in lod_suffix:
-            target_size = int(scene_props.mesh_export_lod3_texture_size)
-        elif "LOD04" in lod_suffix:
-            target_size = int(scene_props.mesh_export_lod4_texture_size)
-        else:
-            target_size = None  # Default to original
+    if resize_textures and lod_level is not None:
+        target_size = lod_sizes[lod_level]
 
     logger.info(f"Target texture size for {lod_suffix}: {target_size or 'original'}")
 
+    # Pass 1 (main thread): classify and size each unique image. Materials on
+    # LOD objects often share textures, so each image is inspected and saved
+    # once and every node using it is repointed. Pixels are not read yet, so
+    # full-resolution buffers are only held while they are being resampled.
+    textures = {}  # {img.name_full: job}
+
     for mat in materials:
         if not mat or not mat.node_tree:
             continue
 
         for node in mat.node_tree.nodes:
-            if node.type == "TEX_IMAGE" and node.image:
-                img = node.image
+            if node.type != "TEX_IMAGE" or not node.image:
+                continue
+            img = node.image
 
-                # Skip if no data
-                if not img.has_data:
-                    continue
+            # Skip if no data
+            if not img.has_data:
+                continue
 
-                # Detect texture type
-                is_normal = is_normal_map(node, img)
+            key = img.name_full
+            if key in textures:
+                textures[key]["nodes"].append(node)
+                continue
 
-                # Get format info
+            try:
+                # Detect texture type and format (first node using the image
+                # decides its classification)
+                is_normal = is_normal_map(node, img)
                 format_string, has_alpha, is_hdr = get_texture_format_info(img)
 
                 # Determine file extension based on format
-                ext_map = {
-                    "JPEG": ".jpg",
-                    "PNG": ".png",
-                    "TARGA": ".tga",
-                    "HDR": ".hdr",
-                    "OPEN_EXR": ".exr",
-                }
-                ext = ext_map.get(format_string, ".jpg")
+                ext = TEXTURE_FORMAT_EXTENSIONS.get(format_string, ".jpg")
 
                 # Create external filename
                 base_name = os.path.splitext(img.name)[0]
                 external_filename = f"{base_name}{lod_suffix}{ext}"
-                external_path = os.path.join(export_dir, external_filename)
 
-                try:
-                    # Ensure the image has data loaded
-                    if not img.has_data and img.filepath:
-                        img.reload()
-
-                    # Save a copy of the image (with resizing if needed)
-                    if img.has_data:
-                        img_to_save = img
-                        temp_img = None
-
-                        # Check if we need to resize
-                        orig_width, orig_height = img.size
-
-                        # Adjust target size for normal maps if preservation is enabled
-                        adjusted_target_size = target_size
-                        if (
-                            is_normal
-                            and scene_props
-                            and scene_props.mesh_export_preserve_normal_maps
-                            and target_size
-                        ):
-                            # Keep normal maps at one LOD level higher
-                            if "LOD02" in lod_suffix:
-                                adjusted_target_size = int(
-                                    scene_props.mesh_export_lod1_texture_size
-                                )
-                            elif "LOD03" in lod_suffix:
-                                adjusted_target_size = int(
-                                    scene_props.mesh_export_lod2_texture_size
-                                )
-                            elif "LOD04" in lod_suffix:
-                                adjusted_target_size = int(
-                                    scene_props.mesh_export_lod3_texture_size
-                                )
-                            logger.info(
-                                f"Preserving normal map quality: "
-                                f"{target_size} → {adjusted_target_size}"
-                            )
+                # Check if we need to resize
+                orig_width, orig_height = img.size
 
-                        # Only resize if image is larger than target (no upscaling)
-                        needs_resize = adjusted_target_size is not None and (
-                            orig_width > adjusted_target_size
-                            or orig_height > adjusted_target_size
-                        )
+                # Adjust target size for normal maps if preservation is enabled
+                adjusted_target_size = target_size
+                if is_normal and preserve_normals and target_size:
+                    # Keep normal maps at one LOD level higher
+                    if lod_level >= 2:
+                        adjusted_target_size = lod_sizes[lod_level - 1]
+                    logger.info(
+                        f"Preserving normal map quality: "
+                        f"{target_size} → {adjusted_target_size}"
+                    )
 
-                        if needs_resize:
-                            # Calculate new dimensions preserving aspect ratio
-                            aspect_ratio = orig_width / orig_height
+                # Only resize if image is larger than target (no upscaling)
+                needs_resize = adjusted_target_size is not None and (
+                    orig_width > adjusted_target_size
+                    or orig_height > adjusted_target_size
+                )
 
-                            if orig_width > orig_height:
-                                new_width = adjusted_target_size
-                                new_height = int(adjusted_target_size / aspect_ratio)
-                            else:
-                                new_height = adjusted_target_size
-                                new_width = int(adjusted_target_size * aspect_ratio)
+                job = {
+                    "img": img,
+                    "nodes": [node],
+                    "is_normal": is_normal,
+                    "format_string": format_string,
+                    "has_alpha": has_alpha,
+                    "is_hdr": is_hdr,
+                    "external_filename": external_filename,
+                    "orig_size": (orig_width, orig_height),
+                    "new_size": None,
+                    "future": None,
+                }
 
-                            # Ensure dimensions are at least 1
-                            new_width = max(1, new_width)
-                            new_height = max(1, new_height)
+                if needs_resize:
+                    # Calculate new dimensions preserving aspect ratio
+                    aspect_ratio = orig_width / orig_height
 
-                            logger.info(
-                                f"Resizing {img.name} from "
-                                f"{orig_width}x{orig_height} to "
-                                f"{new_width}x{new_height}"
-                            )
+                    if orig_width > orig_height:
+                        new_width = adjusted_target_size
+                        new_height = int(adjusted_target_size / aspect_ratio)
+                    else:
+                        new_height = adjusted_target_size
+                        new_width = int(adjusted_target_size * aspect_ratio)
 
-                            # Create a temporary resized copy
-                            temp_img = img.copy()
-                            temp_img.name = f"{img.name}_temp_resize"
+                    # Ensure dimensions are at least 1
+                    job["new_size"] = (max(1, new_width), max(1, new_height))
+                elif adjusted_target_size is not None:
+                    logger.info(
+                        f"Skipping resize for {img.name} "
+                        f"({orig_width}x{orig_height}) - "
+                        f"already smaller than target"
+                    )
 
-                            # Scale the temporary image
-                            temp_img.scale(new_width, new_height)
-                            img_to_save = temp_img
-                        else:
-                            if adjusted_target_size is not None:
-                                logger.info(
-                                    f"Skipping resize for {img.name} "
-                                    f"({orig_width}x{orig_height}) - "
-                                    f"already smaller than target"
-                                )
+                textures[key] = job
 
-                        # Set the save path and format
-                        original_filepath = img_to_save.filepath_raw
-                        img_to_save.filepath_raw = external_path
-                        img_to_save.file_format = format_string
-
-                        # Set JPEG quality if applicable
-                        if format_string == "JPEG" and scene_props:
-                            # Note: Blender's save_render settings affect image saving
-                            scene = bpy.context.scene
-                            original_quality = scene.render.image_settings.quality
-                            scene.render.image_settings.quality = (
-                                scene_props.mesh_export_texture_quality
-                            )
+            except Exception as e:
+                logger.warning(f"Failed to save texture {img.name}: {e}")
+                logger.debug("Texture save traceback", exc_info=True)
+
+    # Pass 2 (streamed): resample on worker threads while the main thread
+    # writes earlier textures. downsample_pixels is pure NumPy and never
+    # touches bpy; reading pixels and all other RNA access (including
+    # Image.save) stay on the main thread. At most in_flight source buffers
+    # are held at once: a texture is only read when a resample slot frees up.
+    to_resize = [job for job in textures.values() if job["new_size"] is not None]
+    in_flight = min(
+        len(to_resize), MAX_TEXTURE_RESAMPLES_IN_FLIGHT, os.cpu_count() or 1
+    )
+    pool = ThreadPoolExecutor(max_workers=in_flight) if in_flight > 1 else None
+    resize_index = {id(job): index for index, job in enumerate(to_resize)}
+    queued = 0  # to_resize[:queued] have been read and submitted
 
-                        # Save the image
-                        img_to_save.save()
+    def queue_resample(job):
+        try:
+            orig_width, orig_height = job["orig_size"]
+            pixels = read_image_pixels(job["img"])
+            job["future"] = pool.submit(
+                downsample_pixels,
+                pixels,
+                orig_width,
+                orig_height,
+                *job["new_size"],
+                pixels.size // (orig_width * orig_height),
+            )
+        except Exception as e:
+            # Surface the read failure when this texture is written
+            job["future"] = Future()
+            job["future"].set_exception(e)
 
-                        # Restore JPEG quality
-                        if format_string == "JPEG" and scene_props:
-                            scene.render.image_settings.quality = original_quality
+    # Pass 3 (main thread): encode and write, then repoint material nodes
+    try:
+        for job in textures.values():
+            if pool is not None and job["new_size"] is not None:
+                # Keep up to in_flight resamples running ahead of the writes
+                window_end = min(resize_index[id(job)] + in_flight, len(to_resize))
+                while queued < window_end:
+                    queue_resample(to_resize[queued])
+                    queued += 1
+
+            img = job["img"]
+            format_string = job["format_string"]
+            external_filename = job["external_filename"]
+            external_path = os.path.join(export_dir, external_filename)
+            orig_width, orig_height = job["orig_size"]
 
-                        # Restore original filepath to avoid affecting the scene
+            try:
+                img_to_save = img
+                temp_img = None
+
+                if job["new_size"] is not None:
+                    new_width, new_height = job["new_size"]
+                    logger.info(
+                        f"Resizing {img.name} from "
+                        f"{orig_width}x{orig_height} to "
+                        f"{new_width}x{new_height}"
+                    )
+
+                    if job["future"] is not None:
+                        resized = job["future"].result()
+                        job["future"] = None  # Release the resampled buffer early
+                    else:
+                        pixels = read_image_pixels(img)
+                        resized = downsample_pixels(
+                            pixels,
+                            orig_width,
+                            orig_height,
+                            new_width,
+                            new_height,
+                            pixels.size // (orig_width * orig_height),
+                        )
+                        del pixels  # Release the full-size buffer early
+
+                    # Write only the target-size buffer into a temporary image,
+                    # rather than copying the full-resolution image and scaling it
+                    temp_img = bpy.data.images.new(
+                        name=f"{img.name}_temp_resize",
+                        width=new_width,
+                        height=new_height,
+                        alpha=job["has_alpha"],
+                        float_buffer=job["is_hdr"],
+                    )
+                    temp_img.colorspace_settings.name = img.colorspace_settings.name
+                    temp_img.pixels.foreach_set(resized)
+                    img_to_save = temp_img
+
+                source_path = (
+                    None
+                    if temp_img
+                    else copyable_image_source(img, format_string, scene_props)
+                )
+                if source_path:
+                    # Unchanged file already in the target format: copy the bytes
+                    # rather than decoding and re-encoding the pixels (unless the
+                    # source already lives at the export path)
+                    if not (
+                        os.path.exists(external_path)
+                        and os.path.samefile(source_path, external_path)
+                    ):
+                        with atomic_write_path(external_path) as write_path:
+                            shutil.copyfile(source_path, write_path)
+                else:
+                    # Set the save path and format. Saving goes to a sibling temp
+                    # file that is renamed into place, so the exporter never
+                    # picks up a half-written texture.
+                    original_filepath = img_to_save.filepath_raw
+                    img_to_save.file_format = format_string
+
+                    # Set JPEG quality if applicable
+                    if format_string == "JPEG" and texture_quality is not None:
+                        # Note: Blender's save_render settings affect image saving
+                        scene = bpy.context.scene
+                        original_quality = scene.render.image_settings.quality
+                        scene.render.image_settings.quality = texture_quality
+
+                    # Save the image
+                    try:
+                        with atomic_write_path(external_path) as write_path:
+                            img_to_save.filepath_raw = write_path
+                            img_to_save.save()
+                    finally:
                         img_to_save.filepath_raw = original_filepath
 
-                        # Clean up temporary image
-                        if temp_img:
-                            bpy.data.images.remove(temp_img)
+                    # Restore JPEG quality
+                    if format_string == "JPEG" and texture_quality is not None:
+                        scene.render.image_settings.quality = original_quality
 
-                        # Create a new image that references the external file
-                        external_img = bpy.data.images.load(external_path)
-                        external_img.name = f"{img.name}_external"
+                    # Clean up temporary image
+                    if temp_img:
+                        bpy.data.images.remove(temp_img)
 
-                        # Preserve colorspace settings
-                        if hasattr(img, "colorspace_settings"):
-                            external_img.colorspace_settings.name = (
-                                img.colorspace_settings.name
-                            )
+                if img.source == "FILE":
+                    # Exporters only need a file-backed path, so repoint the image
+                    # itself instead of decoding the file we just wrote into a new
+                    # datablock. filepath_raw (unlike filepath) does not reload.
+                    original_references[img] = img.filepath_raw
+                    img.filepath_raw = external_path
+                else:
+                    # Generated images have no file to point at; load the written
+                    # file as a new image that references it
+                    external_img = bpy.data.images.load(external_path)
+                    external_img.name = f"{img.name}_external"
+                    loaded_images.append(external_img)
+
+                    # Preserve colorspace settings
+                    if hasattr(img, "colorspace_settings"):
+                        external_img.colorspace_settings.name = (
+                            img.colorspace_settings.name
+                        )
 
+                    for node in job["nodes"]:
                         # Store original reference for restoration
                         original_references[node] = img
 
                         # Update the material node to use the external image
                         node.image = external_img
 
-                        saved_textures.append(external_filename)
-                        size_info = f"{orig_width}x{orig_height}"
-                        if needs_resize:
-                            size_info += f" → {new_width}x{new_height}"
-                        texture_type = "normal map" if is_normal else "texture"
-                        logger.info(
-                            f"Saved external {texture_type}: "
-                            f"{external_filename} ({size_info}, {format_string})"
-                        )
-                    else:
-                        logger.warning(f"Image {img.name} has no data to save")
+                saved_textures.append(external_filename)
+                size_info = f"{orig_width}x{orig_height}"
+                if job["new_size"] is not None:
+                    size_info += f" → {new_width}x{new_height}"
+                texture_type = "normal map" if job["is_normal"] else "texture"
+                logger.info(
+                    f"Saved external {texture_type}: "
+                    f"{external_filename} ({size_info}, {format_string})"
+                )
 
-                except Exception as e:
-                    logger.warning(f"Failed to save texture {img.name}: {e}")
-                    import traceback
+            except Exception as e:
+                logger.warning(f"Failed to save texture {img.name}: {e}")
+                logger.debug("Texture save traceback", exc_info=True)
+    finally:
+        # Wait for queued resamples even if a write raised
+        if pool is not None:
+            pool.shutdown(wait=True)
 
-                    logger.debug(traceback.format_exc())
+    return saved_textures, original_references, loaded_images
 
-    return saved_textures, original_references
 
+# Images loaded by save_external_textures and detached by
+# restore_material_references, removed together by
+# flush_external_image_removals() once the batch finishes
+_pending_external_images = []
 
-def restore_material_references(original_references):
+
+def flush_external_image_removals():
+    """
+    Remove all queued external images in a single batch_remove call.
+
+    One batch_remove scans image users once for the whole batch, where
+    removing each image as soon as it is detached rescans them every time.
+
+    Returns:
+        int: Number of images removed
+    """
+    images = []
+    for img in _pending_external_images:
+        try:
+            if img.users == 0:
+                images.append(img)
+        except ReferenceError:
+            # Already removed, e.g. by a purge during the batch
+            continue
+    _pending_external_images.clear()
+    if not images:
+        return 0
+    try:
+        bpy.data.batch_remove(ids=images)
+    except Exception as e:
+        logger.warning(f"Failed to remove external images: {e}")
+        return 0
+    logger.debug(f"Cleaned up {len(images)} external image reference(s)")
+    return len(images)
+
+
+def restore_material_references(original_references, loaded_images=()):
     """
     Restore original material node references and clean up external image references.
 
     Args:
-        original_references: Dict mapping nodes to their original images
+        original_references: Dict mapping repointed images to their original
+            filepath_raw, and repointed nodes to their original images
+        loaded_images: Images loaded by save_external_textures, queued for
+            removal at the end of the batch
     """
     for node, original_img in original_references.items():
-        try:
-            # Get the external image we created
-            external_img = node.image
+        if isinstance(node, bpy.types.Image):
+            try:
+                node.filepath_raw = original_img
+            except ReferenceError:
+                logger.debug("Material reference already cleaned up")
+            continue
 
+        try:
             # Restore original image reference
             node.image = original_img
 
-            # Remove the external image from Blender data
-            if external_img and external_img.name.endswith("_external"):
-                try:
-                    bpy.data.images.remove(external_img)
-                    logger.debug(
-                        f"Cleaned up external image reference: {external_img.name}"
-                    )
-                except ReferenceError:
-                    # Image was already removed, which is fine
-                    logger.debug(
-                        f"External image already cleaned up: {external_img.name}"
-                    )
-
         except (ReferenceError, AttributeError):
             # Node or image was already removed, which can happen during cleanup
             logger.debug("Material reference already cleaned up")
         except Exception as e:
             logger.warning(f"Error restoring material reference: {e}")
 
+    # Queue the external images we created for removal at the end of the batch
+    _pending_external_images.extend(loaded_images)
+
+
+def scan_file_sizes(directory, match):
+    """
+    Collect the sizes of files in a directory in a single scandir pass.
+
+    Args:
+        directory (str): Directory to scan (non-recursive)
+        match (callable): Predicate taking a file name; only matching files
+            are included
+
+    Returns:
+        dict: {file name: size in bytes}; empty if the directory is unreadable
+    """
+    sizes = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not match(entry.name):
+                    continue
+                try:
+                    if entry.is_file():
+                        sizes[entry.name] = entry.stat().st_size
+                except OSError:
+                    pass
+    except OSError as e:
+        logger.debug(f"Could not scan {directory} for file sizes: {e}")
+    return sizes
+
+
+def read_glb_json_chunk_size(filepath):
+    """
+    Read the length of the JSON chunk from a GLB file header.
+
+    Args:
+        filepath (str): Path to the .glb file
+
+    Returns:
+        int or None: JSON chunk length in bytes, or None if the file is not a
+        readable GLB
+    """
+    try:
+        with open(filepath, "rb") as f:
+            header = f.read(GLB_HEADER_SIZE + 8)
+    except OSError:
+        return None
+    if len(header) < GLB_HEADER_SIZE + 8 or header[:4] != b"glTF":
+        return None
+    return int.from_bytes(header[GLB_HEADER_SIZE : GLB_HEADER_SIZE + 4], "little")
+
+
+def convert_axis_for_export(axis_value):
+    """Convert axis values like '-Z' to 'NEGATIVE_Z' for OBJ/STL/USD export."""
+    if axis_value.startswith("-"):
+        return f"NEGATIVE_{axis_value[1]}"
+    return axis_value
+
+
+def build_export_args(
+    fmt,
+    export_filepath,
+    scene_props,
+    export_scale=1.0,
+    include_empties=False,
+    exporter_triangulate=False,
+    export_quality=100,
+    downscale_size="KEEP",
+):
+    """
+    Resolve the exporter (operator or writer function) and its arguments.
+
+    Kept separate from the call so the arguments are built once and the
+    exporter can be invoked on whatever selection the caller has set up.
+
+    Args:
+        fmt (str): Export format ("FBX", "OBJ", "GLTF", "USD", "STL")
+        export_filepath (str): Full output path, including extension
+        scene_props (bpy.types.PropertyGroup): Scene properties for export
+        export_scale (float): Scale factor passed to exporters that support it
+        include_empties (bool): Include EMPTY objects in FBX exports
+        exporter_triangulate (bool): Let the exporter triangulate ("Fast")
+        export_quality (int): glTF JPEG/image quality (0-100)
+        downscale_size (str): USDZ texture downscale size
+
+    Returns:
+        tuple: (exporter, kwargs), or (None, {}) for an unsupported format.
+        ``exporter`` is an operator, or write_stl_binary for STL.
+    """
+    if fmt == "FBX":
+        # Determine object types to export
+        fbx_object_types = {"MESH", "EMPTY"} if include_empties else {"MESH"}
+        return bpy.ops.export_scene.fbx, dict(
+            filepath=export_filepath,
+            use_selection=True,
+            # Axis conversion and export scale are already baked into the
+            # geometry by bake_fbx_export_space (setup_export_object), so run
+            # the exporter with NEUTRAL settings: bake_space_transform=False
+            # makes it write the baked geometry raw (fast - skips the slow
+            # per-vertex bake loop, Blender T39251), native axes add no further
+            # rotation, and global_scale=1/100 with apply_unit_scale=False +
+            # FBX_SCALE_NONE cancels the exporter's forced x100 on the node
+            # while keeping UnitScaleFactor=1.0 in the header (Unreal-correct,
+            # issue #9). Net output matches the old bake_space_transform path.
+            global_scale=1.0 / METERS_TO_CENTIMETERS,
+            axis_forward="Y",
+            axis_up="Z",
+            bake_space_transform=False,
+            apply_unit_scale=False,
+            apply_scale_options="FBX_SCALE_NONE",
+            object_types=fbx_object_types,
+            path_mode="STRIP"
+            if not scene_props.mesh_export_embed_textures
+            else "COPY",
+            embed_textures=scene_props.mesh_export_embed_textures,
+            mesh_smooth_type=scene_props.mesh_export_smoothing,
+            use_mesh_modifiers=False,  # Handled by apply_mesh_modifiers
+            # Off unless "Fast" method: then the exporter triangulates here
+            # instead of the separate triangulate_mesh pass.
+            use_triangles=exporter_triangulate,
+        )
+    elif fmt == "OBJ":
+        return bpy.ops.wm.obj_export, dict(
+            filepath=export_filepath,
+            export_selected_objects=True,
+            # Pass scale to exporter instead of applying to mesh
+            global_scale=export_scale,
+            forward_axis=convert_axis_for_export(
+                scene_props.mesh_export_coord_forward
+            ),
+            up_axis=convert_axis_for_export(scene_props.mesh_export_coord_up),
+            export_materials=True,
+            path_mode="STRIP",  # OBJ doesn't embed textures
+            export_normals=True,
+            export_smooth_groups=True,
+            apply_modifiers=False,  # Handled by apply_mesh_modifiers
+            # Off unless "Fast" method (exporter-side triangulation).
+            export_triangulated_mesh=exporter_triangulate,
+        )
+    elif fmt == "GLTF":
+        # GLTF doesn't support global scale - warn if scale is not 1.0
+        if abs(export_scale - 1.0) > 1e-6:
+            logger.warning(
+                f"Scale {export_scale} will NOT be applied for GLTF "
+                "export (format limitation). Export at original size "
+                "or apply scale manually before export."
+            )
+
+        # For GLTF, textures are always embedded in GLB or copied with GLTF
+        return bpy.ops.export_scene.gltf, dict(
+            filepath=export_filepath,
+            use_selection=True,
+            export_format=scene_props.mesh_export_gltf_type,
+            export_apply=False,  # Transforms/Mods applied manually
+            export_texcoords=True,  # Explicitly export UVs
+            export_normals=True,
+            export_tangents=False,
+            export_materials=scene_props.mesh_export_gltf_materials,
+            export_vertex_color="MATERIAL",
+            export_cameras=False,
+            export_lights=False,
+            export_skins=False,  # Disable skin export to reduce size
+            export_animations=False,  # Disable animation export to reduce size
+            export_extras=False,  # Disable extras to reduce size
+            export_yup=True,  # Use Y-Up coordinate system
+            # Texture settings
+            export_texture_dir="",  # Export textures to same directory as GLTF
+            export_jpeg_quality=export_quality,
+            export_image_quality=export_quality,
+            export_def_bones=False,  # Don't export bones
+            # Enable Draco compression for geometry based on user setting
+            export_draco_mesh_compression_enable=(
+                scene_props.mesh_export_use_draco_compression
+            ),
+            export_draco_mesh_compression_level=6,
+            export_draco_position_quantization=14,
+            export_draco_normal_quantization=10,
+            export_draco_texcoord_quantization=12,
+        )
+    elif fmt == "USD":
+        # USD doesn't support global scale - warn if scale is not 1.0
+        if abs(export_scale - 1.0) > 1e-6:
+            logger.warning(
+                f"Scale {export_scale} will NOT be applied for USD "
+                "export (format limitation). Export at original size "
+                "or apply scale manually before export."
+            )
+
+        return bpy.ops.wm.usd_export, dict(
+            filepath=export_filepath,
+            selected_objects_only=True,
+            export_global_forward_selection=(
+                convert_axis_for_export(scene_props.mesh_export_coord_forward)
+            ),
+            export_global_up_selection=(
+                convert_axis_for_export(scene_props.mesh_export_coord_up)
+            ),
+            export_meshes=True,
+            export_materials=True,
+            export_normals=True,
+            generate_preview_surface=False,
+            use_instancing=False,
+            evaluation_mode="RENDER",
+            # Off unless "Fast" method (exporter-side triangulation).
+            triangulate_meshes=exporter_triangulate,
+            # Need to add a prop to track material quality
+            usdz_downscale_size=downscale_size,
+            # Blender 4.4+ replaced the boolean `export_textures` with
+            # the `export_textures_mode` enum; "NEW" copies textures
+            # alongside the export (the old True behaviour).
+            export_textures_mode="NEW",
+            overwrite_textures=True,
+        )
+    elif fmt == "STL":
+        # Written directly from the (already modifier-applied) mesh data
+        # rather than through bpy.ops.wm.stl_export
+        return write_stl_binary, dict(
+            filepath=export_filepath,
+            axis_forward=scene_props.mesh_export_coord_forward,
+            axis_up=scene_props.mesh_export_coord_up,
+            # Scale is applied to the written coordinates, not the mesh
+            global_scale=export_scale,
+            # The batch drains the queued write via flush_background_writes()
+            background=True,
+        )
+    return None, {}
+
+
+def log_export_size(
+    export_filepath, export_basename, file_size, fmt, scene_props, external_textures
+):
+    """
+    Log the size of an exported file, plus its textures where known.
+
+    Only called when INFO logging is enabled: the texture figures need a scan
+    of the export directory (and the GLB split a header read), which would be
+    wasted I/O if the message were then discarded.
+
+    Args:
+        export_filepath (str): Full path of the exported file
+        export_basename (str): File name used in the log message
+        file_size (int): Size of the exported file in bytes
+        fmt (str): Export format
+        scene_props (bpy.types.PropertyGroup): Scene properties for export
+        external_textures (list): Texture file names saved next to the export
+
+    Returns:
+        None
+    """
+    export_dir = os.path.dirname(export_filepath)
+    file_size_mb = file_size / (1024 * 1024)
+
+    # Calculate approximate size breakdown for GLTF/GLB
+    size_info = f"Size: {file_size_mb:.2f} MB"
+
+    # Add external texture info if any were saved
+    if external_textures:
+        wanted = set(external_textures)
+        total_texture_size = sum(
+            scan_file_sizes(export_dir, lambda name: name in wanted).values()
+        )
+
+        if total_texture_size > 0:
+            texture_size_mb = total_texture_size / (1024 * 1024)
+            size_info += (
+                f" + {len(external_textures)} texture(s): {texture_size_mb:.2f} MB"
+            )
+            size_info += f" (Total: {file_size_mb + texture_size_mb:.2f} MB)"
+
+    # For GLTF JSON format, also check for other texture files
+    elif fmt == "GLTF" and scene_props.mesh_export_gltf_type == "GLTF_SEPARATE":
+        # Look for common image formats in the same directory
+        texture_files = scan_file_sizes(
+            export_dir,
+            lambda name: name.lower().endswith(GLTF_TEXTURE_EXTENSIONS),
+        )
+
+        if texture_files:
+            total_texture_size = sum(texture_files.values())
+            texture_size_mb = total_texture_size / (1024 * 1024)
+            size_info += f" + {len(texture_files)} texture(s): {texture_size_mb:.2f} MB"
+            size_info += f" (Total: {file_size_mb + texture_size_mb:.2f} MB)"
+
+    elif fmt == "GLTF" and scene_props.mesh_export_gltf_type == "GLB":
+        # Real JSON/binary split from the GLB chunk headers
+        json_size = read_glb_json_chunk_size(export_filepath)
+        if json_size is not None:
+            # 12-byte file header plus an 8-byte header per chunk
+            bin_size = max(0, file_size - GLB_HEADER_SIZE - 8 - json_size - 8)
+            size_info += (
+                f" (JSON: {json_size / 1024:.1f} KB, "
+                f"binary: {bin_size / (1024 * 1024):.2f} MB)"
+            )
+
+    logger.info("Successfully exported %s (%s)", export_basename, size_info)
+
 
 def export_object(
     obj,
@@ -2884,8 +3643,7 @@ def export_object(
     """
     fmt = scene_props.mesh_export_format
     success = False
-    # base_file_path = os.path.splitext(file_path)[0] # Ensure no extension yet
-    base_file_path = file_path
+    base_file_path = file_path  # Callers pass the path without an extension
 
     # "Fast" triangulation defers to the format exporter (use_triangles etc.) instead
     # of the separate triangulate_mesh pass, which is skipped for this method.
@@ -2901,46 +3659,40 @@ def export_object(
             export_filepath = f"{base_file_path}.gltf"
     else:
         export_filepath = f"{base_file_path}.{fmt.lower()}"
+    export_dir, export_basename = os.path.split(export_filepath)
+
+    # Parse the LOD suffix (e.g. "_LOD02") once for quality and texture naming
+    lod_match = LOD_SUFFIX_RE.search(obj.name)
+    lod_suffix = lod_match.group(0) if lod_match else ""
+    lod_level = int(lod_match.group(1)) if lod_match else None
 
-    temp_lod_lvl = obj.name.split("_")[-1]
-
-    if temp_lod_lvl == "LOD01":
-        export_quality = math.ceil(scene_props.mesh_export_lod_ratio_01 * 100)
-        downscale_size = "2048"
-    elif temp_lod_lvl == "LOD02":
-        export_quality = math.ceil(scene_props.mesh_export_lod_ratio_02 * 100)
-        downscale_size = "1024"
-    elif temp_lod_lvl == "LOD03":
-        export_quality = math.ceil(scene_props.mesh_export_lod_ratio_03 * 100)
-        downscale_size = "512"
-    elif temp_lod_lvl == "LOD04":
-        export_quality = math.ceil(scene_props.mesh_export_lod_ratio_04 * 100)
-        downscale_size = "256"
+    if lod_level in USDZ_LOD_DOWNSCALE_SIZES:
+        export_quality = math.ceil(
+            getattr(scene_props, f"mesh_export_lod_ratio_{lod_level:02d}") * 100
+        )
+        downscale_size = USDZ_LOD_DOWNSCALE_SIZES[lod_level]
     else:
         export_quality = 100
         downscale_size = "KEEP"
 
-    # Check mesh size and optimise if needed
-    mesh_size = len(obj.data.polygons) if obj.data else 0
+    # Check mesh size and optimise if needed. The count only feeds log
+    # messages and the opt-in GC, so skip the RNA read when neither is active
+    log_info = logger.isEnabledFor(logging.INFO)
+    mesh_size = 0
+    if (log_info or FORCE_GC) and obj.data:
+        mesh_size = len(obj.data.polygons)
     if mesh_size > LARGE_MESH_THRESHOLD:
-        logger.info(f"Large mesh export: {mesh_size:,} polygons")
-        MeshOperations.update_mesh_data(obj, with_memory_cleanup=True)
-        MeshOperations.update_view_layer()
+        logger.info("Large mesh export: %d polygons", mesh_size)
+        # No mesh/view layer update here: the exporter evaluates the
+        # depsgraph itself
+        MemoryManager.request_cleanup(poly_count=mesh_size)
 
     # Save external textures if not embedding
     external_textures = []
     original_references = {}
+    loaded_images = []
     if not scene_props.mesh_export_embed_textures:
-        export_dir = os.path.dirname(export_filepath)
-        lod_suffix = ""
-
-        # Extract LOD suffix from object name if present
-        if "_LOD" in obj.name:
-            lod_part = obj.name.split("_LOD")[-1]
-            if len(lod_part) == 2 and lod_part.isdigit():
-                lod_suffix = f"_LOD{lod_part}"
-
-        external_textures, original_references = save_external_textures(
+        external_textures, original_references, loaded_images = save_external_textures(
             obj,
             export_dir,
             lod_suffix,
@@ -2948,247 +3700,78 @@ def export_object(
             scene_props,
         )
 
-    logger.info(
-        f"Exporting {os.path.basename(export_filepath)} ({fmt}) - "
-        f"{mesh_size:,} polygons..."
-    )
+    if log_info:
+        logger.info(
+            "Exporting %s (%s) - %d polygons...", export_basename, fmt, mesh_size
+        )
 
-    # Convert axis values for OBJ and STL export
-    def convert_axis_for_export(axis_value):
-        """Convert axis values like '-Z' to 'NEGATIVE_Z' for OBJ/STL export."""
-        if axis_value.startswith("-"):
-            return f"NEGATIVE_{axis_value[1]}"
-        return axis_value
+    export_operator, export_kwargs = build_export_args(
+        fmt,
+        export_filepath,
+        scene_props,
+        export_scale=export_scale,
+        include_empties=include_empties,
+        exporter_triangulate=exporter_triangulate,
+        export_quality=export_quality,
+        downscale_size=downscale_size,
+    )
 
     # Use existing selection for batch exports, or create temp context
     # for single exports
-    selection_context = (
-        contextlib.nullcontext()
-        if use_existing_selection
-        else temp_selection_context(
+    if use_existing_selection:
+        selection_context = contextlib.nullcontext()
+    elif fmt in ("FBX", "STL"):
+        # The FBX exporter and write_stl_binary read context.selected_objects,
+        # so an override selects the objects without touching (and
+        # re-syncing) the scene selection. glTF checks select_get() and the
+        # C++ exporters read the view layer's base flags, so those still need
+        # a real selection.
+        export_objects = [obj] + list(extra_objects or [])
+        selection_context = bpy.context.temp_override(
+            active_object=obj,
+            selected_objects=export_objects,
+            selected_editable_objects=export_objects,
+        )
+    else:
+        selection_context = temp_selection_context(
             bpy.context,
             active_object=obj,
             selected_objects=[obj] + list(extra_objects or []),
         )
-    )
 
     with selection_context:
         try:
-            if fmt == "FBX":
-                # Determine object types to export
-                fbx_object_types = {"MESH", "EMPTY"} if include_empties else {"MESH"}
-                bpy.ops.export_scene.fbx(
-                    filepath=export_filepath,
-                    use_selection=True,
-                    # Axis conversion and export scale are already baked into the
-                    # geometry by bake_fbx_export_space (setup_export_object), so run
-                    # the exporter with NEUTRAL settings: bake_space_transform=False
-                    # makes it write the baked geometry raw (fast - skips the slow
-                    # per-vertex bake loop, Blender T39251), native axes add no further
-                    # rotation, and global_scale=1/100 with apply_unit_scale=False +
-                    # FBX_SCALE_NONE cancels the exporter's forced x100 on the node
-                    # while keeping UnitScaleFactor=1.0 in the header (Unreal-correct,
-                    # issue #9). Net output matches the old bake_space_transform path.
-                    global_scale=1.0 / METERS_TO_CENTIMETERS,
-                    axis_forward="Y",
-                    axis_up="Z",
-                    bake_space_transform=False,
-                    apply_unit_scale=False,
-                    apply_scale_options="FBX_SCALE_NONE",
-                    object_types=fbx_object_types,
-                    path_mode="STRIP"
-                    if not scene_props.mesh_export_embed_textures
-                    else "COPY",
-                    embed_textures=scene_props.mesh_export_embed_textures,
-                    mesh_smooth_type=scene_props.mesh_export_smoothing,
-                    use_mesh_modifiers=False,  # Handled by apply_mesh_modifiers
-                    # Off unless "Fast" method: then the exporter triangulates here
-                    # instead of the separate triangulate_mesh pass.
-                    use_triangles=exporter_triangulate,
-                )
-            elif fmt == "OBJ":
-                bpy.ops.wm.obj_export(
-                    filepath=export_filepath,
-                    export_selected_objects=True,
-                    # Pass scale to exporter instead of applying to mesh
-                    global_scale=export_scale,
-                    forward_axis=convert_axis_for_export(
-                        scene_props.mesh_export_coord_forward
-                    ),
-                    up_axis=convert_axis_for_export(scene_props.mesh_export_coord_up),
-                    export_materials=True,
-                    path_mode="STRIP",  # OBJ doesn't embed textures
-                    export_normals=True,
-                    export_smooth_groups=True,
-                    apply_modifiers=False,  # Handled by apply_mesh_modifiers
-                    # Off unless "Fast" method (exporter-side triangulation).
-                    export_triangulated_mesh=exporter_triangulate,
-                )
-            elif fmt == "GLTF":
-                # GLTF doesn't support global scale - warn if scale is not 1.0
-                if abs(export_scale - 1.0) > 1e-6:
-                    logger.warning(
-                        f"Scale {export_scale} will NOT be applied for GLTF "
-                        "export (format limitation). Export at original size "
-                        "or apply scale manually before export."
-                    )
-
-                # For GLTF, textures are always embedded in GLB or copied with GLTF
-                bpy.ops.export_scene.gltf(
-                    filepath=export_filepath,
-                    use_selection=True,
-                    export_format=scene_props.mesh_export_gltf_type,
-                    export_apply=False,  # Transforms/Mods applied manually
-                    export_texcoords=True,  # Explicitly export UVs
-                    export_normals=True,
-                    export_tangents=False,
-                    export_materials=scene_props.mesh_export_gltf_materials,
-                    export_vertex_color="MATERIAL",
-                    export_cameras=False,
-                    export_lights=False,
-                    export_skins=False,  # Disable skin export to reduce size
-                    export_animations=False,  # Disable animation export to reduce size
-                    export_extras=False,  # Disable extras to reduce size
-                    export_yup=True,  # Use Y-Up coordinate system
-                    # Texture settings
-                    export_texture_dir="",  # Export textures to same directory as GLTF
-                    export_jpeg_quality=export_quality,
-                    export_image_quality=export_quality,
-                    export_def_bones=False,  # Don't export bones
-                    # Enable Draco compression for geometry based on user setting
-                    export_draco_mesh_compression_enable=(
-                        scene_props.mesh_export_use_draco_compression
-                    ),
-                    export_draco_mesh_compression_level=6,
-                    export_draco_position_quantization=14,
-                    export_draco_normal_quantization=10,
-                    export_draco_texcoord_quantization=12,
-                )
-            elif fmt == "USD":
-                # USD doesn't support global scale - warn if scale is not 1.0
-                if abs(export_scale - 1.0) > 1e-6:
-                    logger.warning(
-                        f"Scale {export_scale} will NOT be applied for USD "
-                        "export (format limitation). Export at original size "
-                        "or apply scale manually before export."
-                    )
-
-                bpy.ops.wm.usd_export(
-                    filepath=export_filepath,
-                    selected_objects_only=True,
-                    export_global_forward_selection=(
-                        convert_axis_for_export(scene_props.mesh_export_coord_forward)
-                    ),
-                    export_global_up_selection=(
-                        convert_axis_for_export(scene_props.mesh_export_coord_up)
-                    ),
-                    export_meshes=True,
-                    export_materials=True,
-                    export_normals=True,
-                    generate_preview_surface=False,
-                    use_instancing=False,
-                    evaluation_mode="RENDER",
-                    # Off unless "Fast" method (exporter-side triangulation).
-                    triangulate_meshes=exporter_triangulate,
-                    # Need to add a prop to track material quality
-                    usdz_downscale_size=downscale_size,
-                    # Blender 4.4+ replaced the boolean `export_textures` with
-                    # the `export_textures_mode` enum; "NEW" copies textures
-                    # alongside the export (the old True behaviour).
-                    export_textures_mode="NEW",
-                    overwrite_textures=True,
-                )
-            elif fmt == "STL":
-                bpy.ops.wm.stl_export(
-                    filepath=export_filepath,
-                    export_selected_objects=True,
-                    # Pass scale to exporter instead of applying to mesh
-                    global_scale=export_scale,
-                    forward_axis=convert_axis_for_export(
-                        scene_props.mesh_export_coord_forward
-                    ),
-                    up_axis=convert_axis_for_export(scene_props.mesh_export_coord_up),
-                    apply_modifiers=False,  # Handled by apply_mesh_modifiers
-                )
-            else:
-                logger.error(f"Unsupported export format '{fmt}'")
+            if export_operator is None:
+                logger.error("Unsupported export format '%s'", fmt)
                 return False
+            export_operator(**export_kwargs)
 
-            # Get file size
-            file_size = os.path.getsize(export_filepath)
-            file_size_mb = file_size / (1024 * 1024)
-
-            # Calculate approximate size breakdown for GLTF/GLB
-            size_info = f"Size: {file_size_mb:.2f} MB"
-
-            # Add external texture info if any were saved
-            if external_textures:
-                export_dir = os.path.dirname(export_filepath)
-                total_texture_size = 0
-
-                for tex_filename in external_textures:
-                    tex_path = os.path.join(export_dir, tex_filename)
-                    try:
-                        total_texture_size += os.path.getsize(tex_path)
-                    except OSError:
-                        pass
-
-                if total_texture_size > 0:
-                    texture_size_mb = total_texture_size / (1024 * 1024)
-                    size_info += (
-                        f" + {len(external_textures)} texture(s): "
-                        f"{texture_size_mb:.2f} MB"
-                    )
-                    size_info += f" (Total: {file_size_mb + texture_size_mb:.2f} MB)"
-
-            # For GLTF JSON format, also check for other texture files
-            elif fmt == "GLTF" and scene_props.mesh_export_gltf_type == "GLTF_SEPARATE":
-                export_dir = os.path.dirname(export_filepath)
-                texture_files = []
-                total_texture_size = 0
-
-                # Look for common image formats in the same directory
-                for ext in [".jpg", ".jpeg", ".png", ".webp"]:
-                    pattern = os.path.join(export_dir, f"*{ext}")
-                    import glob
-
-                    texture_files.extend(glob.glob(pattern))
-
-                if texture_files:
-                    for tex_file in texture_files:
-                        try:
-                            total_texture_size += os.path.getsize(tex_file)
-                        except OSError:
-                            pass
-
-                    texture_size_mb = total_texture_size / (1024 * 1024)
-                    size_info += (
-                        f" + {len(texture_files)} texture(s): {texture_size_mb:.2f} MB"
-                    )
-                    size_info += f" (Total: {file_size_mb + texture_size_mb:.2f} MB)"
-
-            elif fmt == "GLTF" and scene_props.mesh_export_gltf_type == "GLB":
-                # Rough estimate: with compression, ~100 bytes per triangle
-                estimated_mesh_size_mb = (mesh_size * 100) / (1024 * 1024)
-                estimated_texture_size_mb = file_size_mb - estimated_mesh_size_mb
-                if estimated_texture_size_mb > 0:
-                    size_info += (
-                        f" (est. mesh: {estimated_mesh_size_mb:.1f} MB, "
-                        f"textures: {estimated_texture_size_mb:.1f} MB)"
+            if export_kwargs.get("background"):
+                # Still being written on a worker thread; the batch confirms
+                # it through flush_background_writes() before counting it
+                logger.info("Queued %s for writing", export_basename)
+            else:
+                # Get file size (also confirms the exporter wrote the file)
+                file_size = os.path.getsize(export_filepath)
+                if log_info:
+                    log_export_size(
+                        export_filepath,
+                        export_basename,
+                        file_size,
+                        fmt,
+                        scene_props,
+                        external_textures,
                     )
-
-            logger.info(
-                f"Successfully exported {os.path.basename(export_filepath)} "
-                f"({size_info})"
-            )
             success = True
         except Exception as e:
-            logger.error(f"Failed exporting {obj.name} as {fmt}: {e}", exc_info=True)
+            logger.error(
+                "Failed exporting %s as %s: %s", obj.name, fmt, e, exc_info=True
+            )
             success = False
         finally:
             # Restore original material references if we modified them
-            if original_references:
-                restore_material_references(original_references)
+            if original_references or loaded_images:
+                restore_material_references(original_references, loaded_images)
                 logger.debug("Restored original material references")
 
     return success
@@ -3226,7 +3809,7 @@ def cleanup_object(obj, obj_name_for_log):
     if not obj:
         return
     log_name = obj_name_for_log if obj_name_for_log else "unnamed object"
-    logger.info(f"Attempting cleanup for: {log_name}")
+    logger.info("Attempting cleanup for: %s", log_name)
 
     # No texture restoration needed with the new simple system
     pass
@@ -3239,7 +3822,7 @@ def cleanup_object(obj, obj_name_for_log):
         was_large_mesh = poly_count > LARGE_MESH_THRESHOLD
 
         bpy.data.objects.remove(obj, do_unlink=True)
-        logger.info(f"Cleaned up object: {log_name}")
+        logger.info("Cleaned up object: %s", log_name)
 
         # If the mesh data had only this object as a user, remove it too
         if num_users == 1 and mesh_data:
@@ -3248,19 +3831,138 @@ def cleanup_object(obj, obj_name_for_log):
                 if was_large_mesh and hasattr(mesh_data, "clear_geometry"):
                     mesh_data.clear_geometry()
                 bpy.data.meshes.remove(mesh_data)
-                logger.info(f"Cleaned up orphaned mesh data for: {log_name}")
+                logger.info("Cleaned up orphaned mesh data for: %s", log_name)
             except (ReferenceError, Exception) as mesh_remove_e:
                 logger.warning(
-                    f"Issue removing mesh data for {log_name}: {mesh_remove_e}"
+                    "Issue removing mesh data for %s: %s", log_name, mesh_remove_e
                 )
 
         # Force garbage collection for large meshes
         if was_large_mesh:
             MemoryManager.request_cleanup(force=True)
-            logger.info(f"Memory cleanup completed for large mesh: {log_name}")
+            logger.info("Memory cleanup completed for large mesh: %s", log_name)
 
     except (ReferenceError, Exception) as remove_e:
-        logger.warning(f"Issue during cleanup of {log_name}: {remove_e}")
+        logger.warning("Issue during cleanup of %s: %s", log_name, remove_e)
+
+
+def remove_objects(objects, label="objects"):
+    """
+    Removes temporary objects, and mesh data only they use, in a single batch.
+
+    One ``bpy.data.batch_remove`` call replaces a per-object
+    ``bpy.data.objects.remove`` loop. Falls back to cleanup_object per item if
+    the batch is rejected (e.g. one reference was already removed).
+
+    Args:
+        objects (list): The objects to remove. None entries are ignored.
+        label (str): Description used in log messages.
+
+    Returns:
+        None
+    """
+    objects = [obj for obj in objects if obj]
+    if not objects:
+        return
+
+    try:
+        ids = list(objects)
+        for obj in objects:
+            # Only drop mesh data this object is the sole user of
+            if obj.type == "MESH" and obj.data and obj.data.users == 1:
+                ids.append(obj.data)
+        bpy.data.batch_remove(ids=ids)
+        logger.info(f"Cleaned up {len(objects)} {label}")
+    except (ReferenceError, RuntimeError) as e:
+        logger.debug(f"Batch removal of {label} failed ({e}), removing singly")
+        for obj in objects:
+            try:
+                cleanup_object(obj, obj.name)
+            except ReferenceError:
+                pass  # Already removed
+
+
+def read_processing_settings(scene_props):
+    """
+    Read the per-object processing settings once for a whole batch.
+
+    The batch loop and its LOD passes consult these for every object and LOD
+    level; reading them up front avoids a PropertyGroup (RNA) lookup each time.
+
+    Args:
+        scene_props (bpy.types.PropertyGroup): Scene properties for export
+
+    Returns:
+        types.SimpleNamespace: Settings snapshot. ``lod_ratios`` starts with
+        1.0 for LOD0, followed by one ratio per enabled LOD level.
+    """
+    lod_ratios = (
+        scene_props.mesh_export_lod_ratio_01,
+        scene_props.mesh_export_lod_ratio_02,
+        scene_props.mesh_export_lod_ratio_03,
+        scene_props.mesh_export_lod_ratio_04,
+    )
+    return SimpleNamespace(
+        lod=scene_props.mesh_export_lod,
+        lod_ratios=(1.0,) + lod_ratios[: scene_props.mesh_export_lod_count],
+        apply_modifiers=scene_props.mesh_export_apply_modifiers,
+        tri=scene_props.mesh_export_tri,
+        tri_method=scene_props.mesh_export_tri_method,
+        keep_normals=scene_props.mesh_export_keep_normals,
+        lod_type=scene_props.mesh_export_lod_type,
+        lod_symmetry_axis=scene_props.mesh_export_lod_symmetry_axis,
+        lod_symmetry=scene_props.mesh_export_lod_symmetry,
+    )
+
+
+def prepare_export_copy(
+    original_obj,
+    context,
+    scene_props,
+    settings,
+    lod_level=None,
+    skip_zero_location=False,
+    prebake_fbx_space=True,
+):
+    """
+    Create the processed base copy shared by every export path.
+
+    Copies the object, sets it up for export (naming, location, scale),
+    applies modifiers and triangulates when enabled. If any step fails the
+    copy and any temporary metaball mesh are removed before re-raising, so
+    callers only take ownership of a fully prepared copy.
+
+    Args:
+        original_obj (bpy.types.Object): The object being exported.
+        context (bpy.context): The current Blender context.
+        scene_props (bpy.types.PropertyGroup): Scene properties for export.
+        settings (types.SimpleNamespace): Snapshot from read_processing_settings.
+        lod_level (int, optional): LOD level for naming. Defaults to None.
+        skip_zero_location (bool): Passed through to setup_export_object.
+        prebake_fbx_space (bool): Passed through to setup_export_object.
+
+    Returns:
+        tuple: (copy, temp_metaball_mesh or None, name, base_name, export_scale)
+    """
+    copy_obj, temp_metaball_mesh = create_export_copy(original_obj, context)
+    try:
+        name, base_name, export_scale = setup_export_object(
+            copy_obj,
+            original_obj.name,
+            scene_props,
+            lod_level,
+            skip_zero_location=skip_zero_location,
+            prebake_fbx_space=prebake_fbx_space,
+        )
+        apply_mesh_modifiers(copy_obj, settings.apply_modifiers)
+        if settings.tri:
+            triangulate_mesh(copy_obj, settings.tri_method, settings.keep_normals)
+    except Exception:
+        cleanup_object(copy_obj, f"{original_obj.name} export copy")
+        if temp_metaball_mesh:
+            cleanup_object(temp_metaball_mesh, "temp_metaball_mesh")
+        raise
+    return copy_obj, temp_metaball_mesh, name, base_name, export_scale
 
 
 # --- Preset System Helper Functions ---
@@ -3806,7 +4508,7 @@ class MESH_OT_batch_export(Operator):
     def poll(cls, context):
         """Enable only if mesh, curve, or metaball objects are selected."""
         return any(
-            obj.type in ["MESH", "CURVE", "META"] for obj in context.selected_objects
+            obj.type in EXPORTABLE_OBJECT_TYPES for obj in context.selected_objects
         )
 
     def invoke(self, context, event):
@@ -3817,7 +4519,7 @@ class MESH_OT_batch_export(Operator):
         objects_to_export = [
             obj
             for obj in context.selected_objects
-            if obj.type in ["MESH", "CURVE", "META"]
+            if obj.type in EXPORTABLE_OBJECT_TYPES
         ]
 
         # Check if we're in batch glTF mode with multiple objects
@@ -3890,11 +4592,12 @@ class MESH_OT_batch_export(Operator):
             ValidationError: If validation fails
         """
         scene_props = context.scene.mesh_exporter
-        # Get selected objects for export
+        # Snapshot the selection once: the export steps reselect objects, so
+        # everything downstream works from this list, never the live selection
         objects_to_export = [
             obj
             for obj in context.selected_objects
-            if obj.type in ["MESH", "CURVE", "META"]
+            if obj.type in EXPORTABLE_OBJECT_TYPES
         ]
 
         if not objects_to_export:
@@ -3944,19 +4647,20 @@ class MESH_OT_batch_export(Operator):
 
         export_base_path = bpy.path.abspath(scene_props.mesh_export_path)
 
-        # Check if path exists or can be created
-        if not os.path.isdir(export_base_path):
-            try:
-                os.makedirs(export_base_path, exist_ok=True)
-                logger.info(f"Created export directory: {export_base_path}")
-            except OSError as e:
-                raise ResourceError(
-                    f"Cannot create export directory '{export_base_path}': {e}"
-                ) from e
-            except Exception as e:
-                raise ResourceError(
-                    f"Unexpected error creating export directory: {e}"
-                ) from e
+        # Create the directory if needed. makedirs(exist_ok=True) is a no-op
+        # for an existing directory, so no separate isdir() probe (and no
+        # check-then-create race); a file at the path still raises OSError
+        try:
+            os.makedirs(export_base_path, exist_ok=True)
+            logger.debug(f"Export directory ready: {export_base_path}")
+        except OSError as e:
+            raise ResourceError(
+                f"Cannot create export directory '{export_base_path}': {e}"
+            ) from e
+        except Exception as e:
+            raise ResourceError(
+                f"Unexpected error creating export directory: {e}"
+            ) from e
 
         # Check if directory is writable
         if not os.access(export_base_path, os.W_OK):
@@ -3965,7 +4669,7 @@ class MESH_OT_batch_export(Operator):
         return objects_to_export, export_base_path, hierarchy_mode
 
     def _process_object_hierarchy_export(
-        self, obj, context, scene_props, export_base_path
+        self, obj, context, scene_props, export_base_path, settings
     ):
         """Process individual object hierarchy export with LODs.
 
@@ -3975,237 +4679,210 @@ class MESH_OT_batch_export(Operator):
         logger.info(f"Processing object '{obj.name}' for hierarchy export")
         successful_exports = 0
         failed_exports = []
-        temp_metaball_mesh = None
         temp_empties = []  # Track temporary empties for cleanup
         lod_objects = []
-        parent_empty = None
+        hierarchy_objects = []  # LOD copies and their parent empty
 
-        try:
-            # Get LOD ratios
-            lod_ratios_prop = [
-                scene_props.mesh_export_lod_ratio_01,
-                scene_props.mesh_export_lod_ratio_02,
-                scene_props.mesh_export_lod_ratio_03,
-                scene_props.mesh_export_lod_ratio_04,
-            ]
-            ratios = [1.0] + lod_ratios_prop[: scene_props.mesh_export_lod_count]
-
-            # Create all LOD objects
-            base_lod_obj = None
+        with contextlib.ExitStack() as cleanup:
+            # Callbacks run LIFO and read the lists at exit, so objects appended
+            # below are cleaned up whether we return early, raise, or finish.
+            cleanup.callback(remove_objects, hierarchy_objects, "LOD hierarchy")
+            cleanup.callback(remove_objects, temp_empties, "temporary empties")
 
-            for lod_level, target_ratio in enumerate(ratios):
-                if lod_level == 0:
-                    # LOD0: Create base copy with all processing
-                    logger.info("Creating base LOD0...")
-                    lod_obj, temp_metaball_mesh = create_export_copy(obj, context)
-
-                    # Setup object (naming, location, scale). Keep the exporter's own
-                    # bake (prebake_fbx_space=False): this hierarchy is exported as a
-                    # LodGroup empty with parented children, so geometry-only pre-baking
-                    # would desync the empty's node transform from its children.
-                    (lod_obj_name, base_name, export_scale) = setup_export_object(
-                        lod_obj, obj.name, scene_props, lod_level,
-                        prebake_fbx_space=False,
-                    )
-
-                    # Apply modifiers if needed
-                    apply_mesh_modifiers(
-                        lod_obj, scene_props.mesh_export_apply_modifiers
-                    )
-
-                    # Triangulate if needed
-                    if scene_props.mesh_export_tri:
-                        method = scene_props.mesh_export_tri_method
-                        k_nrms = scene_props.mesh_export_keep_normals
-                        triangulate_mesh(lod_obj, method, k_nrms)
+            try:
+                ratios = settings.lod_ratios
 
-                    base_lod_obj = lod_obj
-                else:
-                    # LOD1+: Create copy and apply progressive decimation
-                    logger.info(f"Creating LOD{lod_level} with ratio {target_ratio}...")
-
-                    # Create a copy of the base LOD
-                    lod_obj = base_lod_obj.copy()
-                    lod_obj.data = base_lod_obj.data.copy()
-                    context.collection.objects.link(lod_obj)
-
-                    # Only rename for LOD level (scale/location already handled in LOD0)
-                    # Note: We pass the original object name, not the
-                    # LOD0's modified name
-                    # prebake_fbx_space=False: LodGroup hierarchy keeps
-                    # the exporter bake.
-                    (lod_obj_name, _, _) = setup_export_object(
-                        lod_obj, obj.name, scene_props, lod_level,
-                        prebake_fbx_space=False,
-                    )
+                # Create all LOD objects
+                base_lod_obj = None
 
-                    # Apply decimation via the shared helper so the
-                    # COLLAPSE-only ratio guard and symmetry handling stay
-                    # consistent with the other LOD paths. Pass the absolute
-                    # target_ratio: each hierarchy LOD is decimated from the
-                    # full-density base copy, not progressively from the
-                    # previous LOD.
-                    apply_decimate_modifier(
-                        lod_obj,
-                        target_ratio,
-                        scene_props.mesh_export_lod_type,
-                        scene_props.mesh_export_lod_symmetry_axis,
-                        scene_props.mesh_export_lod_symmetry,
-                    )
+                for lod_level, target_ratio in enumerate(ratios):
+                    if lod_level == 0:
+                        # LOD0: Create base copy with all processing
+                        logger.info("Creating base LOD0...")
+                        # Keep the exporter's own bake (prebake_fbx_space=False):
+                        # this hierarchy is exported as a LodGroup empty with
+                        # parented children, so geometry-only pre-baking would
+                        # desync the empty's node transform from its children.
+                        (
+                            lod_obj,
+                            temp_metaball_mesh,
+                            lod_obj_name,
+                            base_name,
+                            export_scale,
+                        ) = prepare_export_copy(
+                            obj, context, scene_props, settings, lod_level,
+                            prebake_fbx_space=False,
+                        )
+                        if temp_metaball_mesh:
+                            cleanup.callback(
+                                remove_objects,
+                                [temp_metaball_mesh],
+                                "temp_metaball_mesh",
+                            )
+                        hierarchy_objects.append(lod_obj)
+                        base_lod_obj = lod_obj
+                    else:
+                        # LOD1+: Create copy and apply progressive decimation
+                        logger.info(
+                            f"Creating LOD{lod_level} with ratio {target_ratio}..."
+                        )
 
-                lod_objects.append(lod_obj)
+                        # Create a copy of the base LOD
+                        lod_obj = base_lod_obj.copy()
+                        lod_obj.data = base_lod_obj.data.copy()
+                        context.collection.objects.link(lod_obj)
+                        hierarchy_objects.append(lod_obj)
+
+                        # Only rename for LOD level (scale/location already handled
+                        # in LOD0). Note: We pass the original object name, not the
+                        # LOD0's modified name.
+                        lod_obj.name = compute_export_name(
+                            obj.name, scene_props, lod_level
+                        )[0]
+
+                        # Apply decimation via the shared helper so the
+                        # COLLAPSE-only ratio guard and symmetry handling stay
+                        # consistent with the other LOD paths. Pass the absolute
+                        # target_ratio: each hierarchy LOD is decimated from the
+                        # full-density base copy, not progressively from the
+                        # previous LOD.
+                        apply_decimate_modifier(
+                            lod_obj,
+                            target_ratio,
+                            settings.lod_type,
+                            settings.lod_symmetry_axis,
+                            settings.lod_symmetry,
+                        )
 
-            # Create hierarchy structure (base_lod_obj is LOD0, first in list).
-            # Use base_name (prefix/convention applied) so the LodGroup node -
-            # and therefore the imported engine asset - carries the prefix.
-            parent_empty = create_lod_hierarchy(
-                lod_objects[0], lod_objects[1:], base_name, context
-            )
+                    lod_objects.append(lod_obj)
 
-            # Handle attachment empties - parent to LOD0
-            convention = resolve_naming(scene_props)[2]
-            attachment_empties = get_attachment_empties(obj, scene_props)
-            for empty in attachment_empties:
-                empty_copy = copy_empty_for_export(
-                    empty, lod_objects[0], context, convention
-                )
-                temp_empties.append(empty_copy)
-
-            # Create slot empties if enabled - parent to LOD0
-            slot_empties = create_slot_empties(obj, scene_props, context)
-            for slot_empty in slot_empties:
-                slot_empty.parent = lod_objects[0]
-                # Recalculate local matrix after parenting
-                slot_world = slot_empty.matrix_world.copy()
-                slot_empty.matrix_local = (
-                    lod_objects[0].matrix_world.inverted() @ slot_world
+                # Create hierarchy structure (base_lod_obj is LOD0, first in list).
+                # Use base_name (prefix/convention applied) so the LodGroup node -
+                # and therefore the imported engine asset - carries the prefix.
+                parent_empty = create_lod_hierarchy(
+                    lod_objects[0], lod_objects[1:], base_name, context
                 )
-                temp_empties.append(slot_empty)
-
-            # Handle collision meshes - parent to LOD0 (tracked in temp_empties
-            # so they're selected for the inline FBX export below)
-            collisions = get_collision_meshes(obj, scene_props)
-            for idx, (collision_obj, shape) in enumerate(collisions):
-                collision_copy = copy_collision_for_export(
-                    collision_obj,
-                    lod_objects[0],
-                    base_name,
-                    shape,
-                    idx,
-                    context,
-                    scene_props,
-                )
-                temp_empties.append(collision_copy)
+                hierarchy_objects.append(parent_empty)
+
+                # Handle attachment empties - parent to LOD0
+                convention = resolve_naming(scene_props)[2]
+                attachment_empties = get_attachment_empties(obj, scene_props)
+                for empty in attachment_empties:
+                    empty_copy = copy_empty_for_export(
+                        empty, lod_objects[0], context, convention
+                    )
+                    temp_empties.append(empty_copy)
+
+                # Create slot empties if enabled - parent to LOD0
+                slot_empties = create_slot_empties(obj, scene_props, context)
+                for slot_empty in slot_empties:
+                    slot_empty.parent = lod_objects[0]
+                    # Recalculate local matrix after parenting
+                    slot_world = slot_empty.matrix_world.copy()
+                    slot_empty.matrix_local = (
+                        lod_objects[0].matrix_world.inverted() @ slot_world
+                    )
+                    temp_empties.append(slot_empty)
+
+                # Handle collision meshes - parent to LOD0 (tracked in temp_empties
+                # so they're selected for the inline FBX export below)
+                collisions = get_collision_meshes(obj, scene_props)
+                for idx, (collision_obj, shape) in enumerate(collisions):
+                    collision_copy = copy_collision_for_export(
+                        collision_obj,
+                        lod_objects[0],
+                        base_name,
+                        shape,
+                        idx,
+                        context,
+                        scene_props,
+                    )
+                    temp_empties.append(collision_copy)
+
+            except Exception as e:
+                logger.error(f"Failed to process object hierarchy: {e}")
+                failed_exports.append(f"{obj.name} (Processing failed: {e})")
+                return successful_exports, failed_exports
 
             # Export the hierarchy as FBX
             # Use base_name which includes prefix/suffix but not LOD suffix
             export_path = os.path.join(export_base_path, f"{base_name}_LODGroup.fbx")
 
-            # Select all LOD objects, parent, and empties for export
-            bpy.ops.object.select_all(action="DESELECT")
-            parent_empty.select_set(True)
-            for lod_obj in lod_objects:
-                lod_obj.select_set(True)
-            for temp_empty in temp_empties:
-                temp_empty.select_set(True)
-            context.view_layer.objects.active = parent_empty
+            # Export the parent, all LOD objects and the empties. The FBX
+            # exporter reads context.selected_objects, so an override selects
+            # them without select_all or touching the user's selection (as
+            # export_object does for per-object FBX exports)
+            export_objects = [parent_empty, *lod_objects, *temp_empties]
 
             # Determine object types based on whether we have empties
             fbx_object_types = {"MESH", "EMPTY"} if temp_empties else {"MESH", "EMPTY"}
 
-            # Export FBX with hierarchy
+            # Export FBX with hierarchy - the only call here expected to fail
+            # for reasons outside our control (disk, permissions, exporter).
+            # Stage the write only when textures are embedded: with path_mode
+            # "AUTO" the exporter records texture paths relative to the file it
+            # writes, which would be wrong once moved out of the temp directory.
             try:
-                bpy.ops.export_scene.fbx(
-                    filepath=export_path,
-                    use_selection=True,
-                    # Match the per-object FBX export: bake scaling into the
-                    # geometry (UnitScaleFactor=1.0) so Unreal imports at the
-                    # correct scale (issue #9). export_scale already carries the
-                    # units conversion from setup_export_object; divide by
-                    # METERS_TO_CENTIMETERS to cancel the exporter's forced x100.
-                    global_scale=export_scale / METERS_TO_CENTIMETERS,
-                    apply_unit_scale=False,
-                    apply_scale_options="FBX_SCALE_NONE",
-                    axis_forward=scene_props.mesh_export_coord_forward,
-                    axis_up=scene_props.mesh_export_coord_up,
-                    # Bake axis conversion into geometry so it survives re-import
-                    # (Blender T95408) - matches the per-object FBX export above.
-                    bake_space_transform=True,
-                    object_types=fbx_object_types,
-                    use_mesh_modifiers=False,  # Already applied
-                    # "Fast" method skips the separate triangulate pass, so let the
-                    # exporter triangulate the LOD meshes here instead.
-                    use_triangles=(
-                        scene_props.mesh_export_tri
-                        and scene_props.mesh_export_tri_method == "FAST"
-                    ),
-                    mesh_smooth_type=scene_props.mesh_export_smoothing,
-                    use_tspace=True,
-                    path_mode="COPY"
-                    if scene_props.mesh_export_embed_textures
-                    else "AUTO",
-                    embed_textures=scene_props.mesh_export_embed_textures,
-                )
+                with staged_export_file(
+                    export_path,
+                    enabled=scene_props.mesh_export_embed_textures,
+                    background=True,
+                    # The batch counts every LOD in this one file
+                    exports=len(lod_objects),
+                ) as write_path, context.temp_override(
+                    active_object=parent_empty,
+                    selected_objects=export_objects,
+                    selected_editable_objects=export_objects,
+                ):
+                    bpy.ops.export_scene.fbx(
+                        filepath=write_path,
+                        use_selection=True,
+                        # Match the per-object FBX export: bake scaling into the
+                        # geometry (UnitScaleFactor=1.0) so Unreal imports at the
+                        # correct scale (issue #9). export_scale already carries the
+                        # units conversion from setup_export_object; divide by
+                        # METERS_TO_CENTIMETERS to cancel the exporter's forced x100.
+                        global_scale=export_scale / METERS_TO_CENTIMETERS,
+                        apply_unit_scale=False,
+                        apply_scale_options="FBX_SCALE_NONE",
+                        axis_forward=scene_props.mesh_export_coord_forward,
+                        axis_up=scene_props.mesh_export_coord_up,
+                        # Bake axis conversion into geometry so it survives re-import
+                        # (Blender T95408) - matches the per-object FBX export above.
+                        bake_space_transform=True,
+                        object_types=fbx_object_types,
+                        use_mesh_modifiers=False,  # Already applied
+                        # "Fast" method skips the separate triangulate pass, so let the
+                        # exporter triangulate the LOD meshes here instead.
+                        use_triangles=(
+                            settings.tri
+                            and settings.tri_method == "FAST"
+                        ),
+                        mesh_smooth_type=scene_props.mesh_export_smoothing,
+                        use_tspace=True,
+                        path_mode="COPY"
+                        if scene_props.mesh_export_embed_textures
+                        else "AUTO",
+                        embed_textures=scene_props.mesh_export_embed_textures,
+                    )
                 successful_exports = len(lod_objects)  # All LODs including base
                 logger.info(f"Successfully exported hierarchy to {export_path}")
             except Exception as e:
                 failed_exports.append(f"{obj.name} (Export failed: {e})")
                 logger.error(f"Failed to export hierarchy: {e}")
 
-        except Exception as e:
-            logger.error(f"Failed to process object hierarchy: {e}")
-            failed_exports.append(f"{obj.name} (Processing failed: {e})")
-
-        finally:
-            # Clean up temporary empties
-            for temp_empty in temp_empties:
-                cleanup_object(
-                    temp_empty, temp_empty.name if temp_empty else "temp_empty"
-                )
-
-            # Clean up temporary objects
-            if parent_empty:
-                try:
-                    bpy.data.objects.remove(parent_empty, do_unlink=True)
-                except (ReferenceError, Exception) as e:
-                    logger.warning(f"Issue cleaning up parent_empty: {e}")
-
-            for lod_obj in lod_objects:
-                try:
-                    bpy.data.objects.remove(lod_obj, do_unlink=True)
-                except (ReferenceError, Exception) as e:
-                    logger.warning(f"Issue cleaning up lod_obj: {e}")
-
-            # Clean up temporary metaball mesh if it exists
-            if temp_metaball_mesh:
-                try:
-                    # temp_metaball_mesh is an Object, we need to remove
-                    # both object and mesh data
-                    mesh_data = temp_metaball_mesh.data
-                    bpy.data.objects.remove(temp_metaball_mesh, do_unlink=True)
-                    if mesh_data:
-                        bpy.data.meshes.remove(mesh_data, do_unlink=True)
-                except (ReferenceError, Exception) as e:
-                    logger.warning(f"Issue cleaning up temp_metaball_mesh: {e}")
-
         return successful_exports, failed_exports
 
-    def _process_lod_export(self, original_obj, context, scene_props, export_base_path):
+    def _process_lod_export(
+        self, original_obj, context, scene_props, export_base_path, settings
+    ):
         """Process LOD export for a single object.
 
         Returns:
             tuple: (success_count, failed_list)
         """
-        logger.info(f"Generating {scene_props.mesh_export_lod_count + 1} LOD levels...")
-
-        # Get LOD ratios
-        lod_ratios_prop = [
-            scene_props.mesh_export_lod_ratio_01,
-            scene_props.mesh_export_lod_ratio_02,
-            scene_props.mesh_export_lod_ratio_03,
-            scene_props.mesh_export_lod_ratio_04,
-        ]
-        ratios = [1.0] + lod_ratios_prop[: scene_props.mesh_export_lod_count]
+        ratios = settings.lod_ratios
+        logger.info(f"Generating {len(ratios)} LOD levels...")
 
         # Initialise tracking variables
         successful_exports = 0
@@ -4213,6 +4890,12 @@ class MESH_OT_batch_export(Operator):
         base_lod_obj = None
         previous_ratio = 1.0
         temp_metaball_mesh = None
+        # Measured once up front, for the memory cleanup after the LOD loop
+        poly_count = (
+            len(original_obj.data.polygons)
+            if original_obj.type == "MESH" and original_obj.data
+            else 0
+        )
 
         try:
             for lod_level, target_ratio in enumerate(ratios):
@@ -4223,14 +4906,14 @@ class MESH_OT_batch_export(Operator):
                     if lod_level == 0:
                         # LOD0: Create base copy with modifiers applied
                         logger.info("Creating base LOD0...")
-                        lod_obj, temp_metaball_mesh = create_export_copy(
-                            original_obj, context
-                        )
-                        (lod_obj_name, _, export_scale) = setup_export_object(
-                            lod_obj, original_obj.name, scene_props, lod_level
-                        )
-                        apply_mesh_modifiers(
-                            lod_obj, scene_props.mesh_export_apply_modifiers
+                        (
+                            lod_obj,
+                            temp_metaball_mesh,
+                            lod_obj_name,
+                            _,
+                            export_scale,
+                        ) = prepare_export_copy(
+                            original_obj, context, scene_props, settings, lod_level
                         )
                         base_lod_obj = lod_obj
                     else:
@@ -4249,28 +4932,27 @@ class MESH_OT_batch_export(Operator):
                             f"(from {previous_ratio:.3f} to {target_ratio:.3f})"
                         )
 
-                        # Rename for current LOD
-                        (lod_obj_name, _, export_scale) = setup_export_object(
-                            base_lod_obj, original_obj.name, scene_props, lod_level
-                        )
+                        # Rename for current LOD. Transforms, scale and the FBX
+                        # space bake were applied to this mesh at LOD0; running
+                        # the full setup again would bake them a second time.
+                        # export_scale carries over from LOD0.
+                        base_lod_obj.name = compute_export_name(
+                            original_obj.name, scene_props, lod_level
+                        )[0]
+                        lod_obj_name = base_lod_obj.name
 
                         # Apply progressive decimation
                         apply_decimate_modifier(
                             base_lod_obj,
                             progressive_ratio,
-                            scene_props.mesh_export_lod_type,
-                            scene_props.mesh_export_lod_symmetry_axis,
-                            scene_props.mesh_export_lod_symmetry,
+                            settings.lod_type,
+                            settings.lod_symmetry_axis,
+                            settings.lod_symmetry,
                         )
                         lod_obj = base_lod_obj
 
-                    # Triangulate if needed (applies to all LODs)
-                    if scene_props.mesh_export_tri and lod_level == 0:
-                        method = scene_props.mesh_export_tri_method
-                        k_nrms = scene_props.mesh_export_keep_normals
-                        triangulate_mesh(lod_obj, method, k_nrms)
-
-                    # Export current LOD
+                    # Export current LOD (LOD0 was triangulated when prepared;
+                    # decimating a triangulated mesh keeps it triangulated)
                     lod_file_path = os.path.join(export_base_path, lod_obj_name)
                     if export_object(lod_obj, lod_file_path, scene_props, export_scale):
                         successful_exports += 1
@@ -4299,18 +4981,14 @@ class MESH_OT_batch_export(Operator):
                 cleanup_object(temp_metaball_mesh, "temp_metaball_mesh")
 
             # Memory cleanup for large meshes
-            if (
-                original_obj.type == "MESH"
-                and len(original_obj.data.polygons if original_obj.data else [])
-                > LARGE_MESH_THRESHOLD
-            ):
-                MemoryManager.request_cleanup()
+            if poly_count > LARGE_MESH_THRESHOLD:
+                MemoryManager.request_cleanup(poly_count=poly_count)
                 logger.debug("Memory cleanup after LOD level processing")
 
         return successful_exports, failed_exports
 
     def _process_single_export(
-        self, original_obj, context, scene_props, export_base_path
+        self, original_obj, context, scene_props, export_base_path, settings
     ):
         """Process non-LOD export for a single object.
 
@@ -4325,22 +5003,16 @@ class MESH_OT_batch_export(Operator):
 
         try:
             logger.info("Processing single export (no LODs)..")
-            export_obj, temp_metaball_mesh = create_export_copy(original_obj, context)
+            (
+                export_obj,
+                temp_metaball_mesh,
+                export_obj_name,
+                base_name,
+                export_scale,
+            ) = prepare_export_copy(original_obj, context, scene_props, settings)
 
             # Use context manager for the export object
             with temporary_object(export_obj, export_obj_name) as obj:
-                (export_obj_name, base_name, export_scale) = setup_export_object(
-                    obj, original_obj.name, scene_props
-                )
-                apply_mesh_modifiers(obj, scene_props.mesh_export_apply_modifiers)
-
-                if scene_props.mesh_export_tri:
-                    triangulate_mesh(
-                        obj,
-                        scene_props.mesh_export_tri_method,
-                        scene_props.mesh_export_keep_normals,
-                    )
-
                 # Handle attachment empties (only for FBX and glTF)
                 include_empties = False
                 if scene_props.mesh_export_format in ("FBX", "GLTF"):
@@ -4429,6 +5101,7 @@ class MESH_OT_batch_export(Operator):
         context,
         scene_props,
         export_base_path,
+        settings,
         override_name=None,
     ):
         """Process batch glTF export - combine all objects into single file.
@@ -4472,40 +5145,29 @@ class MESH_OT_batch_export(Operator):
                         f"{len(objects_to_export)}: {original_obj.name}"
                     )
 
-                    # Create export copy
-                    export_obj, temp_metaball_mesh = create_export_copy(
-                        original_obj, context
-                    )
-                    if temp_metaball_mesh:
-                        temp_metaball_meshes.append(temp_metaball_mesh)
-
-                    # Process the base object (LOD0 or single export)
+                    # Create and process the base copy (LOD0 or single export).
                     # Skip zero location for batch to preserve spatial relationships
-                    (export_obj_name, base_name, export_scale) = setup_export_object(
+                    (
                         export_obj,
-                        original_obj.name,
+                        temp_metaball_mesh,
+                        export_obj_name,
+                        base_name,
+                        export_scale,
+                    ) = prepare_export_copy(
+                        original_obj,
+                        context,
                         scene_props,
+                        settings,
                         skip_zero_location=True,
                     )
+                    if temp_metaball_mesh:
+                        temp_metaball_meshes.append(temp_metaball_mesh)
 
                     # Track scale from first object
                     # (all objects use same scene_props settings)
                     if idx == 0:
                         batch_export_scale = export_scale
 
-                    # Apply modifiers
-                    apply_mesh_modifiers(
-                        export_obj, scene_props.mesh_export_apply_modifiers
-                    )
-
-                    # Triangulate if needed
-                    if scene_props.mesh_export_tri:
-                        triangulate_mesh(
-                            export_obj,
-                            scene_props.mesh_export_tri_method,
-                            scene_props.mesh_export_keep_normals,
-                        )
-
                     # Add to processed list and track for cleanup
                     processed_objects.append(export_obj)
                     temp_objects.append(export_obj)
@@ -4559,17 +5221,10 @@ class MESH_OT_batch_export(Operator):
                         )  # Include in export selection
 
                     # Handle LOD generation if enabled
-                    if scene_props.mesh_export_lod:
+                    if settings.lod:
                         logger.info(f"Generating LODs for {original_obj.name}...")
-                        lod_count = scene_props.mesh_export_lod_count
-
-                        # Get LOD ratios
-                        lod_ratios = [
-                            scene_props.mesh_export_lod_ratio_01,
-                            scene_props.mesh_export_lod_ratio_02,
-                            scene_props.mesh_export_lod_ratio_03,
-                            scene_props.mesh_export_lod_ratio_04,
-                        ]
+                        lod_count = len(settings.lod_ratios) - 1
+                        lod_ratios = settings.lod_ratios[1:]
 
                         # Generate LODs using progressive building
                         base_lod_obj = export_obj
@@ -4603,9 +5258,9 @@ class MESH_OT_batch_export(Operator):
                                 apply_decimate_modifier(
                                     lod_obj,
                                     progressive_ratio,
-                                    scene_props.mesh_export_lod_type,
-                                    scene_props.mesh_export_lod_symmetry_axis,
-                                    scene_props.mesh_export_lod_symmetry,
+                                    settings.lod_type,
+                                    settings.lod_symmetry_axis,
+                                    settings.lod_symmetry,
                                 )
 
                                 # Add to processed list
@@ -4645,8 +5300,8 @@ class MESH_OT_batch_export(Operator):
                 f"as single glTF file: {batch_filename}"
             )
 
-            # Deselect all first
-            for obj in context.scene.objects:
+            # Deselect all first (only selected objects need touching)
+            for obj in list(context.selected_objects):
                 obj.select_set(False)
 
             # Select all processed objects (meshes and empties)
@@ -4704,7 +5359,8 @@ class MESH_OT_batch_export(Operator):
             # Memory cleanup for large batch exports
             if len(objects_to_export) > 5 or any(
                 obj.type == "MESH"
-                and len(obj.data.polygons if obj.data else []) > LARGE_MESH_THRESHOLD
+                and obj.data
+                and len(obj.data.polygons) > LARGE_MESH_THRESHOLD
                 for obj in objects_to_export
             ):
                 MemoryManager.request_cleanup()
@@ -4723,7 +5379,8 @@ class MESH_OT_batch_export(Operator):
         )
 
         if failed_exports:
-            unique_fails = sorted(list(set(f.split(" (")[0] for f in failed_exports)))
+            # Records are "<name> (<reason>)"; one object can fail several ways
+            unique_fails = sorted({f.split(" (", 1)[0] for f in failed_exports})
             fail_summary = (
                 f"Failed exports logged for: {len(unique_fails)} original "
                 f"objects ({', '.join(unique_fails[:5])}"
@@ -4735,6 +5392,21 @@ class MESH_OT_batch_export(Operator):
         report_type = {"INFO"} if overall_success else {"WARNING"}
         return message, report_type, overall_success
 
+    def _restore_active_mode(self, context, active, mode):
+        """Make the batch's original active object active again in ``mode``.
+
+        The export paths make temporary copies active (and then delete them),
+        so the object captured before the batch is restored explicitly rather
+        than whatever the view layer points at afterwards.
+        """
+        if active is None:
+            return
+        try:
+            context.view_layer.objects.active = active
+            MeshOperations.safe_mode_set(active, mode)
+        except (ReferenceError, RuntimeError) as e:
+            logger.warning(f"Could not restore {mode.lower()} mode: {e}")
+
     def execute(self, context):
         """Runs the batch export process."""
         start_time = time.time()
@@ -4759,10 +5431,20 @@ class MESH_OT_batch_export(Operator):
 
         # Initialise tracking
         scene_props = context.scene.mesh_exporter
+        # Per-object processing settings, read once for the whole batch
+        settings = read_processing_settings(scene_props)
         wm = context.window_manager
         successful_exports = 0
         failed_exports = []
 
+        # Switch to object mode once for the whole batch (restored in the
+        # finally blocks below). Leaving edit mode flushes pending edits into
+        # the mesh data the export copies are made from, and lets the
+        # per-object helpers assume object mode instead of checking each call
+        active = context.view_layer.objects.active
+        original_mode = active.mode if active else "OBJECT"
+        MeshOperations.safe_mode_set(active, "OBJECT")
+
         # Get total items to process
         total_items = len(objects_to_export)
 
@@ -4797,14 +5479,17 @@ class MESH_OT_batch_export(Operator):
                     context,
                     scene_props,
                     export_base_path,
+                    settings,
                     override_name,
                 )
 
                 # Mark all original objects as exported if successful
                 if successful_exports > 0:
+                    mark_exported = export_indicators.mark_object_as_exported
+                    failed_names = set(failed_exports)  # O(1) membership per object
                     for original_obj in objects_to_export:
-                        if original_obj.name not in failed_exports:
-                            export_indicators.mark_object_as_exported(original_obj)
+                        if original_obj.name not in failed_names:
+                            mark_exported(original_obj)
 
                 wm.progress_update(100)
 
@@ -4818,7 +5503,9 @@ class MESH_OT_batch_export(Operator):
                 return {"CANCELLED"}
             finally:
                 wm.progress_end()
+                flush_external_image_removals()
                 MemoryManager.cleanup_if_pending()
+                self._restore_active_mode(context, active, original_mode)
 
         else:
             # Standard per-object export
@@ -4833,11 +5520,46 @@ class MESH_OT_batch_export(Operator):
                     f"to {export_base_path}"
                 )
 
+            # Export the heaviest meshes first, while the heap is still
+            # unfragmented; later small objects then reuse the freed blocks.
+            # The sort is stable, so ties (and curves/metaballs, which have
+            # no polygons yet) keep their selection order. Objects whose
+            # names resolve to the same export file overwrite each other, and
+            # which file survives depends on order - those batches keep the
+            # selection order so the last selected object still wins.
+            seen_names = set()
+            shared_names = set()
+            for o in objects_to_export:
+                # Case-folded: the file names collide on case-insensitive disks
+                name = compute_export_name(o.name, scene_props)[1].casefold()
+                (shared_names if name in seen_names else seen_names).add(name)
+            if shared_names:
+                logger.warning(
+                    "Objects share export names (%s); later files will "
+                    "overwrite earlier ones. Exporting in selection order.",
+                    ", ".join(sorted(shared_names)),
+                )
+                process_order = objects_to_export
+            else:
+                process_order = sorted(
+                    objects_to_export,
+                    key=lambda o: -len(o.data.polygons) if o.type == "MESH" else 0,
+                )
+
             wm.progress_begin(0, total_items)
+            last_pct = -1
+            # Objects whose exports all succeeded; marked once their queued
+            # background writes are confirmed in the finally block below
+            exported_objects = []
             try:
                 # Process each object
-                for index, original_obj in enumerate(objects_to_export):
-                    wm.progress_update(index + 1)
+                for index, original_obj in enumerate(process_order):
+                    # Only push progress when the percentage moves; each
+                    # update is an RNA call plus a status-bar redraw
+                    pct = (index * 100) // total_items
+                    if pct != last_pct:
+                        wm.progress_update(index + 1)
+                        last_pct = pct
                     logger.info(
                         f"Processing ({index + 1}/{total_items}): {original_obj.name}"
                     )
@@ -4845,33 +5567,29 @@ class MESH_OT_batch_export(Operator):
                     try:
                         # Process with hierarchy mode, regular LOD, or single export
                         if hierarchy_mode:
-                            success_count, failures = (
-                                self._process_object_hierarchy_export(
-                                    original_obj, context, scene_props, export_base_path
-                                )
-                            )
-                        elif scene_props.mesh_export_lod:
-                            success_count, failures = self._process_lod_export(
-                                original_obj, context, scene_props, export_base_path
-                            )
+                            process = self._process_object_hierarchy_export
+                        elif settings.lod:
+                            process = self._process_lod_export
                         else:
-                            success_count, failures = self._process_single_export(
-                                original_obj, context, scene_props, export_base_path
+                            process = self._process_single_export
+                        with background_write_owner(original_obj.name):
+                            success_count, failures = process(
+                                original_obj,
+                                context,
+                                scene_props,
+                                export_base_path,
+                                settings,
                             )
 
                         # Update tracking
                         successful_exports += success_count
                         failed_exports.extend(failures)
 
-                        # Mark object if successful
                         if not failures:
-                            export_indicators.mark_object_as_exported(original_obj)
-                            logger.info(
-                                f"Marked original {original_obj.name} as exported."
-                            )
+                            exported_objects.append(original_obj)
                         else:
                             logger.info(
-                                f"Skipped marking {original_obj.name} due to errors."
+                                "Skipped marking %s due to errors.", original_obj.name
                             )
 
                     except ProcessingError as e:
@@ -4897,8 +5615,30 @@ class MESH_OT_batch_export(Operator):
                 return {"CANCELLED"}
             finally:
                 wm.progress_end()
+                # Staged hierarchy exports and STL files may still be writing;
+                # a file that never landed is a failure, not an export
+                write_failures = flush_background_writes()
+                successful_exports -= sum(n for _, _, n in write_failures)
+                failed_exports.extend(
+                    f"{owner} (Write Error)" for _, owner, _ in write_failures
+                )
+                failed_owners = {owner for _, owner, _ in write_failures}
+                mark_exported = export_indicators.mark_object_as_exported
+                for original_obj in exported_objects:
+                    if original_obj.name in failed_owners:
+                        logger.info(
+                            "Skipped marking %s due to write errors.",
+                            original_obj.name,
+                        )
+                    else:
+                        mark_exported(original_obj)
+                        logger.info(
+                            "Marked original %s as exported.", original_obj.name
+                        )
+                flush_external_image_removals()
                 # Ensure any pending memory cleanup is performed
                 MemoryManager.cleanup_if_pending()
+                self._restore_active_mode(context, active, original_mode)
 
         # Generate and display report
         elapsed_time = time.time() - start_time
@@ -4909,10 +5649,8 @@ class MESH_OT_batch_export(Operator):
         logger.log(logging.INFO if overall_success else logging.WARNING, message)
         self.report(report_type, message)
 
-        # Trigger viewport redraw
-        for window in context.window_manager.windows:
-            for area in window.screen.areas:
-                area.tag_redraw()
+        # Redraw the editors showing export indicators
+        export_indicators.redraw_indicator_areas(context.window_manager)
 
         return {"FINISHED"}
 
@@ -4936,10 +5674,9 @@ class OBJECT_OT_select_by_name(Operator):
             logger.warning(f"Object '{self.object_name}' not found for selection.")
             return {"CANCELLED"}
 
-        # Deselect all objects directly
-        for obj in context.scene.objects:
-            if obj.select_get():
-                obj.select_set(False)
+        # Deselect only what is selected (snapshot: the list shrinks as we go)
+        for obj in list(context.selected_objects):
+            obj.select_set(False)
 
         # Select target and make it active
         target_obj.select_set(True)
@@ -4,6 +4,8 @@ This module tests that the addon correctly exports meshes in all supported
 formats: FBX, OBJ, glTF (GLB and JSON), USD, and STL.
 """
 
+import struct
+
 import bpy
 import pytest
 from conftest import (
@@ -299,6 +301,81 @@ class TestSTLExport:
         expected_file = temp_export_dir / "TestCube.stl"
         assert verify_file_exists(expected_file, "stl"), "Triangulated STL should exist"
 
+    def test_stl_binary_layout(self, create_cube, temp_export_dir, reset_settings):
+        """Test the STL file is a well-formed binary STL of the cube.
+
+        A cube triangulates to 12 facets: an 80-byte header and a uint32
+        triangle count, followed by one 50-byte record per triangle.
+        """
+        props = get_scene_props()
+        props.mesh_export_path = str(temp_export_dir) + "/"
+        props.mesh_export_format = "STL"
+
+        create_cube.select_set(True)
+        result = bpy.ops.mesh.batch_export()
+        assert result == {"FINISHED"}, "STL export should complete successfully"
+
+        data = (temp_export_dir / "TestCube.stl").read_bytes()
+        triangle_count = int.from_bytes(data[80:84], "little")
+        assert triangle_count == 12, "Cube should export as 12 triangles"
+        assert len(data) == 84 + 50 * triangle_count, "File size should match count"
+
+    def test_stl_transform_axes_and_normals(
+        self, create_cube, temp_export_dir, reset_settings
+    ):
+        """Test STL geometry carries location, scale, export axes and outward normals.
+
+        The 2x2x2 cube sits at (3, -2, 5) with scale (2, 1, 0.5), so its world
+        bounds are x 1..5, y -3..-1, z 4.5..5.5. With forward X and up Y,
+        Blender's Y becomes X, Z becomes Y and X becomes Z, so the written
+        coordinates are (y, z, x) doubled by the export scale.
+        """
+        props = get_scene_props()
+        props.mesh_export_path = str(temp_export_dir) + "/"
+        props.mesh_export_format = "STL"
+        props.mesh_export_zero_location = False
+        props.mesh_export_units = "METERS"
+        props.mesh_export_scale = 2.0
+        props.mesh_export_coord_forward = "X"
+        props.mesh_export_coord_up = "Y"
+
+        create_cube.location = (3.0, -2.0, 5.0)
+        create_cube.scale = (2.0, 1.0, 0.5)
+        create_cube.select_set(True)
+        bpy.context.view_layer.objects.active = create_cube
+        result = bpy.ops.mesh.batch_export()
+        assert result == {"FINISHED"}, "STL export should complete successfully"
+
+        data = (temp_export_dir / "TestCube.stl").read_bytes()
+        records = list(struct.iter_unpack("<12fH", data[84:]))
+        assert len(records) == 12, "Cube should export as 12 triangles"
+
+        vertices = [rec[3 + 3 * i : 6 + 3 * i] for rec in records for i in range(3)]
+        expected_bounds = [(-6.0, -2.0), (9.0, 11.0), (2.0, 10.0)]
+        for axis, (low, high) in enumerate(expected_bounds):
+            values = [v[axis] for v in vertices]
+            assert min(values) == pytest.approx(low, abs=1e-4), (
+                f"Minimum on axis {axis} should be {low}"
+            )
+            assert max(values) == pytest.approx(high, abs=1e-4), (
+                f"Maximum on axis {axis} should be {high}"
+            )
+
+        center = (-4.0, 10.0, 6.0)
+        for rec in records:
+            normal = rec[:3]
+            assert sum(n * n for n in normal) == pytest.approx(1.0, abs=1e-4), (
+                "Facet normals should be unit length"
+            )
+            # Outward: points from the box centre towards the facet
+            corners = [rec[3 + 3 * i : 6 + 3 * i] for i in range(3)]
+            facet = [
+                sum(c[axis] for c in corners) / 3 - center[axis] for axis in range(3)
+            ]
+            assert sum(n * f for n, f in zip(normal, facet)) > 0, (
+                "Facet normals should point out of the cube"
+            )
+
 
 class TestCoordinateSystem:
     """Tests for coordinate system and axis configuration."""
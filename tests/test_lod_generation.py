@@ -16,6 +16,64 @@ from conftest import (
 pytestmark = pytest.mark.slow  # LOD tests can be slower
 
 
+def reimport_extents(path):
+    """Import an FBX or glTF file and return the world-space extents of its mesh.
+
+    Imported objects are removed afterwards so the scene is left untouched.
+
+    Args:
+        path (Path): Path to the ``.fbx`` or ``.glb`` file to import.
+
+    Returns:
+        tuple[tuple, tuple]: Per-axis (x, y, z) centre and dimensions of the
+        first imported mesh object's vertices.
+    """
+    before = set(bpy.data.objects)
+    if path.suffix == ".fbx":
+        bpy.ops.import_scene.fbx(filepath=str(path))
+    else:
+        bpy.ops.import_scene.gltf(filepath=str(path))
+    new_objects = [obj for obj in bpy.data.objects if obj not in before]
+    meshes = [obj for obj in new_objects if obj.type == "MESH"]
+    assert meshes, f"No mesh object imported from {path}"
+    matrix = meshes[0].matrix_world
+    coords = [matrix @ v.co for v in meshes[0].data.vertices]
+    lows = [min(co[axis] for co in coords) for axis in range(3)]
+    highs = [max(co[axis] for co in coords) for axis in range(3)]
+
+    # Clean up everything the importer created
+    for obj in new_objects:
+        bpy.data.objects.remove(obj, do_unlink=True)
+
+    center = tuple((lo + hi) / 2 for lo, hi in zip(lows, highs))
+    dimensions = tuple(hi - lo for lo, hi in zip(lows, highs))
+    return center, dimensions
+
+
+def assert_lod_matches_base(export_dir, extension):
+    """Assert LOD01 occupies the same space as LOD00 after re-import.
+
+    Decimation only removes detail, so the extents agree within a small
+    tolerance. Transforms applied twice to LOD1+ would rotate or rescale it.
+    """
+    base_center, base_dims = reimport_extents(
+        export_dir / f"TestSphere_LOD00.{extension}"
+    )
+    lod_center, lod_dims = reimport_extents(
+        export_dir / f"TestSphere_LOD01.{extension}"
+    )
+    tolerance = 0.1 * max(base_dims)
+    for axis in range(3):
+        assert lod_dims[axis] == pytest.approx(base_dims[axis], abs=tolerance), (
+            f"LOD01 size on axis {axis} should match LOD00 "
+            f"(got {lod_dims[axis]} vs {base_dims[axis]})"
+        )
+        assert lod_center[axis] == pytest.approx(base_center[axis], abs=tolerance), (
+            f"LOD01 position on axis {axis} should match LOD00 "
+            f"(got {lod_center[axis]} vs {base_center[axis]})"
+        )
+
+
 class TestBasicLODGeneration:
     """Tests for basic LOD generation functionality."""
 
@@ -413,6 +471,62 @@ class TestLODWithFormats:
         assert result == {"FINISHED"}, "LOD generation with STL should succeed"
 
 
+class TestLODTransforms:
+    """Tests that LOD1+ files keep the transforms applied to LOD0."""
+
+    def test_fbx_lods_with_custom_axes(
+        self, create_sphere, temp_export_dir, reset_settings
+    ):
+        """FBX LODs with non-default axes should match the base LOD's extents.
+
+        LOD1+ reuse the LOD0 copy, whose geometry already has the axis
+        conversion and export scale baked in; they must not be baked again.
+        """
+        props = get_scene_props()
+        props.mesh_export_path = str(temp_export_dir) + "/"
+        props.mesh_export_format = "FBX"
+        props.mesh_export_coord_forward = "X"
+        props.mesh_export_coord_up = "Y"
+        props.mesh_export_lod = True
+        props.mesh_export_lod_count = 1
+        props.mesh_export_lod_ratio_01 = 0.75
+        props.mesh_export_lod_hierarchy = False
+
+        # Distinct extents per axis, so an extra rotation is visible
+        create_sphere.scale = (1.0, 2.0, 3.0)
+        create_sphere.select_set(True)
+        bpy.context.view_layer.objects.active = create_sphere
+        result = bpy.ops.mesh.batch_export()
+        assert result == {"FINISHED"}, "FBX LOD export should succeed"
+
+        assert_lod_matches_base(temp_export_dir, "fbx")
+
+    def test_gltf_lods_with_export_scale(
+        self, create_sphere, temp_export_dir, reset_settings
+    ):
+        """glTF LODs with a non-unit export scale should match the base LOD.
+
+        The export scale is set on the LOD0 object; LOD1+ must not apply it
+        and then set it again.
+        """
+        props = get_scene_props()
+        props.mesh_export_path = str(temp_export_dir) + "/"
+        props.mesh_export_format = "GLTF"
+        props.mesh_export_gltf_type = "GLB"
+        props.mesh_export_scale = 2.0
+        props.mesh_export_lod = True
+        props.mesh_export_lod_count = 1
+        props.mesh_export_lod_ratio_01 = 0.75
+        props.mesh_export_lod_hierarchy = False
+
+        create_sphere.select_set(True)
+        bpy.context.view_layer.objects.active = create_sphere
+        result = bpy.ops.mesh.batch_export()
+        assert result == {"FINISHED"}, "glTF LOD export should succeed"
+
+        assert_lod_matches_base(temp_export_dir, "glb")
+
+
 @pytest.mark.slow
 class TestLODWithLargeMeshes:
     """Tests for LOD generation with large meshes (memory intensive)."""